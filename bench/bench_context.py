@@ -0,0 +1,103 @@
+"""Measure markup context push/pop with chained and copied frames.
+
+Run from the top of a source checkout::
+
+  python bench/bench_context.py [extra-settings] [depth]
+
+Compares :class:`~flatland.out.generic.Context`, whose pushed frames start
+out empty and read settings through from the frames below, with the
+strategy it replaced: copying the whole top frame on every push.  The
+frames are padded with *extra-settings* additional keys, standing in for
+custom settings, and rows are pushed *depth* frames deep, as with nested
+``begin()`` and ``end()`` calls.
+
+"""
+import sys
+import timeit
+
+from flatland import Form, String
+from flatland.out.generic import Context
+from flatland.out.markup import Generator
+
+
+class CopyingContext(Context):
+    """The copy-on-push strategy, for comparison."""
+
+    def push(self, **options):
+        self._frames.append(self._frames[-1].copy())
+        try:
+            self.update(**options)
+        except KeyError:
+            self.pop()
+            raise
+
+    def __getitem__(self, key):
+        return self._frames[-1][key]
+
+    def __contains__(self, key):
+        return key in self._frames[-1]
+
+
+class CopyingGenerator(CopyingContext, Generator):
+    pass
+
+
+class Row(Form):
+    name = String
+    email = String
+
+
+def best_of(fn, number, repeat=9):
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number
+
+
+def padded(context, extra):
+    settings = [('custom_%d' % i, i) for i in range(extra)]
+    for frame in context._frames:
+        # the base frame, and any frames copied from it
+        if type(frame) is dict:
+            frame.update(settings)
+    return context
+
+
+def main(extra=50, depth=2):
+    row = Row({'name': 'x', 'email': 'y'})
+    print('%d extra settings, %d frames per row\n' % (extra, depth))
+    print('%-28s %12s %12s' % ('', 'copy (us)', 'chained (us)'))
+
+    def push_pop(context):
+        def run():
+            for _ in range(depth):
+                context.push()
+            context['auto_domid']
+            context['markup_wrapper']
+            for _ in range(depth):
+                context.pop()
+        return run
+
+    def render_row(generator):
+        def run():
+            for _ in range(depth):
+                generator.begin(auto_domid=True)
+            generator.input(row['name'], type='text')
+            generator.input(row['email'], type='text')
+            for _ in range(depth):
+                generator.end()
+        return run
+
+    rows = [
+        ('push, 2 reads, pop',
+         push_pop(padded(CopyingContext(), extra)),
+         push_pop(padded(Context(), extra))),
+        ('table row with 2 inputs',
+         render_row(padded(CopyingGenerator(), extra)),
+         render_row(padded(Generator(), extra))),
+        ]
+    for label, copying, chained in rows:
+        print('%-28s %12.2f %12.2f' % (label,
+                                      best_of(copying, 2000) * 1e6,
+                                      best_of(chained, 2000) * 1e6))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:3]])
@@ -0,0 +1,63 @@
+"""Measure HTML escaping across value sizes and escaping backends.
+
+Run from the top of a source checkout::
+
+  python bench/bench_escape.py [max-size]
+
+Times :func:`~flatland.out.escape.escape_attribute` with each available
+backend (see :data:`~flatland.out.escape.backends`) on values from 8
+characters up to *max-size*, both with nothing to escape and with an
+escapable character in every few.  The ``replace`` column is the chain of
+``str.replace`` calls previously used for every value, for comparison.
+
+"""
+import sys
+import timeit
+
+from flatland.out import escape
+from flatland.out.escape import escape_attribute
+
+
+def replace_chain(string):
+    return string. \
+           replace('&', '&amp;'). \
+           replace('<', '&lt;'). \
+           replace('>', '&gt;'). \
+           replace('"', '&quot;')
+
+
+def best_of(fn, number, repeat=7):
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number
+
+
+def main(max_size=16384):
+    names = sorted(escape.backends)
+    print('%-18s %12s' % ('', 'replace') +
+          ''.join(' %12s' % name for name in names) + '   (ns per value)')
+
+    sizes = []
+    size = 8
+    while size <= max_size:
+        sizes.append(size)
+        size *= 8
+
+    original = escape._text, escape._attribute
+    try:
+        for size in sizes:
+            for kind, pattern in (('plain', 'abcdefgh'), ('dirty', 'ab<&gh>y'),
+                                  ('quoted', 'ab<&gh"y')):
+                value = (pattern * size)[:size]
+                number = max(20, 200000 // size)
+                row = [best_of(lambda: replace_chain(value), number)]
+                for name in names:
+                    escape.use_backend(name)
+                    row.append(best_of(lambda: escape_attribute(value),
+                                       number))
+                print('%-18s' % ('%d %s' % (size, kind)) +
+                      ''.join(' %12.0f' % (t * 1e9) for t in row))
+    finally:
+        escape._text, escape._attribute = original
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
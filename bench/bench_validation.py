@@ -0,0 +1,87 @@
+"""Measure per-validator overhead of element validation.
+
+Run from the top of a source checkout::
+
+  python bench/bench_validation.py [fields] [validators-per-field]
+
+Compares the generic :func:`~flatland.schema.base.validate_element` path
+with the compiled validator runners used by ``Element.validate``, with and
+without a :obj:`~flatland.signals.validator_validated` receiver connected.
+
+"""
+import sys
+import timeit
+
+from flatland import Form, String
+from flatland.schema.base import compile_validators, validate_element
+from flatland.signals import validator_validated
+from flatland.validation import Validator
+
+
+class Accept(Validator):
+    """A validator doing no work, so that only the call overhead remains."""
+
+    def validate(self, element, state):
+        return True
+
+
+def build_form(fields, per_field):
+    members = dict(
+        ('f%d' % i, String.using(validators=[Accept()
+                                             for _ in range(per_field)]))
+        for i in range(fields))
+    return type('Bench', (Form,), members)
+
+
+def best_of(fn, number, repeat=5):
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number
+
+
+def main(fields=100, per_field=3):
+    schema = build_form(fields, per_field)
+    form = schema.from_flat(dict(('f%d' % i, 'x') for i in range(fields)))
+    leaves = list(form.children)
+    chains = [(leaf, tuple(leaf.validators)) for leaf in leaves]
+    untraced = [(leaf, compile_validators(chain)) for leaf, chain in chains]
+    traced = [(leaf, compile_validators(chain, True))
+              for leaf, chain in chains]
+    calls = fields * per_field
+
+    def generic():
+        for leaf, chain in chains:
+            validate_element(leaf, None, chain)
+
+    def compiled():
+        for leaf, run in untraced:
+            run(leaf, None)
+
+    def compiled_traced():
+        for leaf, run in traced:
+            run(leaf, None)
+
+    def listener(sender, **kw):
+        pass
+
+    number = max(1, 20000 // calls)
+    print('%d fields x %d validators\n' % (fields, per_field))
+    print('%-36s %12s' % ('', 'ns/validator'))
+    rows = [('validate_element', generic),
+            ('compiled runner', compiled),
+            ('Form.validate()', form.validate)]
+    for label, fn in rows:
+        print('%-36s %12.1f' % (label, best_of(fn, number) / calls * 1e9))
+
+    validator_validated.connect(listener)
+    try:
+        rows = [('validate_element, receiver', generic),
+                ('compiled runner, traced', compiled_traced),
+                ('Form.validate(), receiver', form.validate)]
+        for label, fn in rows:
+            print('%-36s %12.1f' % (label,
+                                    best_of(fn, number) / calls * 1e9))
+    finally:
+        validator_validated.disconnect(listener)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:3]])
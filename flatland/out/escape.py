@@ -0,0 +1,121 @@
+"""HTML escaping for generated markup.
+
+Two backends are available: a pure Python escaper, and one handing long
+values to :func:`markupsafe.escape`, used automatically when MarkupSafe is
+installed.  Both produce the same output.  :func:`use_backend` selects a
+backend explicitly.
+
+"""
+try:
+    from markupsafe import escape as _markupsafe_escape
+except ImportError:                                           # pragma:nocover
+    _markupsafe_escape = None
+
+
+__all__ = ('backends', 'escape_attribute', 'escape_text', 'use_backend')
+
+
+def escape_text(string):
+    """Escape *string* for use as element contents.
+
+    Escapes ``&``, ``<`` and ``>``.  Objects with an ``__html__`` method are
+    already markup and are returned unescaped, as unicode.
+
+    """
+    if not string:
+        return ''
+    elif type(string) is not str and hasattr(string, '__html__'):
+        return _unpack(string)
+    return _text(string)
+
+
+def escape_attribute(string):
+    """Escape *string* for use as a double-quoted attribute value.
+
+    As :func:`escape_text`, and also escapes ``"``.
+
+    """
+    if not string:
+        return ''
+    elif type(string) is not str and hasattr(string, '__html__'):
+        return _unpack(string)
+    return _attribute(string)
+
+
+def _python_text(string):
+    # most values have nothing to escape, and a scan for each character is
+    # much cheaper than a replace() that finds nothing.  replace() chains
+    # measure faster than translate() or re.sub() when there is work to do.
+    if '&' in string or '<' in string or '>' in string:
+        return string. \
+               replace('&', '&amp;'). \
+               replace('<', '&lt;'). \
+               replace('>', '&gt;')
+    return string
+
+
+def _python_attribute(string):
+    if '&' in string or '<' in string or '>' in string or '"' in string:
+        return string. \
+               replace('&', '&amp;'). \
+               replace('<', '&lt;'). \
+               replace('>', '&gt;'). \
+               replace('"', '&quot;')
+    return string
+
+
+def _markupsafe_text(string):
+    if '&' in string or '<' in string or '>' in string:
+        if len(string) < _markupsafe_threshold:
+            return _python_text(string)
+        return _unquote(str(_markupsafe_escape(string)), string, '"')
+    return string
+
+
+def _markupsafe_attribute(string):
+    if '&' in string or '<' in string or '>' in string or '"' in string:
+        if len(string) < _markupsafe_threshold:
+            return _python_attribute(string)
+        return _unquote(str(_markupsafe_escape(string)), string, '&quot;')
+    return string
+
+
+def _unquote(escaped, string, double):
+    # markupsafe escapes quotes as numeric references.  A literal '&#34;' in
+    # the source is escaped to '&amp;#34;', so these can be swapped safely.
+    if "'" in string:
+        escaped = escaped.replace('&#39;', "'")
+    if '"' in string:
+        escaped = escaped.replace('&#34;', double)
+    return escaped
+
+
+# the length at which markupsafe's C loop overtakes the replace() chain,
+# below which its call overhead dominates
+_markupsafe_threshold = 256
+
+backends = {'python': (_python_text, _python_attribute)}
+"""The available backends: a mapping of name to (text, attribute) escapers."""
+
+if _markupsafe_escape is not None:
+    backends['markupsafe'] = (_markupsafe_text, _markupsafe_attribute)
+
+
+def use_backend(name):
+    """Escape with the backend *name*, one of :data:`backends`."""
+    global _text, _attribute
+    try:
+        _text, _attribute = backends[name]
+    except KeyError:
+        raise ValueError("Unknown escaping backend %r" % name)
+
+
+use_backend('markupsafe' if 'markupsafe' in backends else 'python')
+
+
+def _unpack(html_string):
+    """Extract HTML unicode from a __html__() interface."""
+    unpacked = html_string.__html__()
+    if unpacked.__class__ is str:
+        return unpacked
+    return str(unpacked)
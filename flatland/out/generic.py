@@ -1,5 +1,7 @@
 import re
+from operator import itemgetter
 
+from flatland.out.escape import escape_text as _markup_escape
 from flatland.out.util import parse_trool
 from flatland.schema import Array, Boolean
 from flatland.util import Maybe, to_pairs
@@ -9,29 +11,129 @@ __all__ = ('transform', 'Context')
 _transforms = []
 _default_context = {}
 _auto_tags = {}
+_toggles = {}
+_plans = {}
 _id_invalid_re = re.compile(r'[^A-Za-z0-9_:.\-]')
 
 
 def transform(tagname, attributes, contents, context, bind):
     """Transform tag *attributes* in-place & return transformed *contents*"""
-    for fn in _transforms:
+    plans = _plans or _compile_plans()
+    if plans['toggles'].isdisjoint(attributes):
+        transforms = _transform_plan(tagname, context, plans)
+    else:
+        transforms = _transforms
+    for fn in transforms:
         contents = fn(tagname, attributes, contents, context, bind)
     return contents
 
 
+def _uses_contents(tagname, attributes, context):
+    """True if transforming *tagname* may read or replace its contents.
+
+    Renderers can stream the contents of other tags without collecting
+    them for :func:`transform`, passing ``None`` instead.
+
+    """
+    if tagname in _contents_tags:
+        return True
+    plans = _plans or _compile_plans()
+    if plans['toggles'].isdisjoint(attributes):
+        transforms = _transform_plan(tagname, context, plans)
+    else:
+        transforms = _transforms
+    return not _contents_blind.issuperset(transforms)
+
+
+def _cacheable(tagname, attributes, context):
+    """True if transforming *tagname* depends only on its inputs.
+
+    That is, on the tag, its attributes and contents, the bound element's
+    name, type and value, and the settings in *context*.  Transforms that
+    change the context, such as an incrementing tabindex, filters that do
+    not declare themselves ``cacheable``, and transforms added with
+    :func:`transformer` are not.
+
+    """
+    plans = _plans or _compile_plans()
+    if not plans['toggles'].isdisjoint(attributes):
+        return False
+    for fn in _transform_plan(tagname, context, plans):
+        if fn is transform_tabindex:
+            if context['tabindex'] > 0:
+                return False
+        elif fn is transform_filters:
+            for filter in context['filters']:
+                if not getattr(filter, 'cacheable', False):
+                    return False
+        elif fn not in _pure_transforms:
+            return False
+    return True
+
+
+def _transform_plan(tagname, context, plans):
+    """Return the transforms that may alter *tagname* in *context*.
+
+    Only valid for tags without a local toggle attribute such as
+    ``auto_name``.  A transform is left out of the plan if its toggle is
+    off in *context*, or if it only acts on other tags unless forced.  Plans
+    are cached by tag name and the toggle settings in effect.
+
+    """
+    settings = context._settings()
+    try:
+        key = tagname, plans['settings'](settings)
+    except KeyError:
+        # a frame that predates a setting
+        return _transforms
+    try:
+        return plans['by_key'][key]
+    except KeyError:
+        pass
+
+    plan = []
+    for fn in _transforms:
+        toggle = _toggles.get(fn)
+        if toggle is None or toggle[0] not in _default_context:
+            plan.append(fn)
+            continue
+        setting, tags = toggle
+        enabled = parse_trool(settings[setting])
+        if enabled is Maybe:
+            enabled = _default_context[setting]
+        if enabled and (tags is None or tagname in tags):
+            plan.append(fn)
+    plans['by_key'][key] = plan = tuple(plan)
+    return plan
+
+
+def _compile_plans():
+    settings = [setting for setting, tags in list(_toggles.values())
+                if setting in _default_context]
+    _plans['toggles'] = frozenset(setting for setting, tags
+                                  in list(_toggles.values()))
+    _plans['settings'] = (itemgetter(*settings) if len(settings) > 1 else
+                          lambda frame: tuple(frame[setting]
+                                              for setting in settings))
+    _plans['by_key'] = {}
+    return _plans
+
+
 class Context(object):
     """A stacked key/value mapping."""
 
     # These methods are public but undocumented.  For friendly, user-facing
     # versions, see the Generator subclass.
 
+    _flattened = None
+
     def __init__(self):
         self._frames = [dict(_default_context)]
 
     def push(self, **options):
-        # for this size dict & usage pattern, copying turns out to be cheaper
-        # than directing __getitem__ down through a stack of sparse frames.
-        self._frames.append(self._frames[-1].copy())
+        # frames hold only the settings made in them; reads go through the
+        # flattened mapping, see _settings()
+        self._frames.append({})
         try:
             self.update(**options)
         except KeyError:
@@ -42,18 +144,35 @@ class Context(object):
         if len(self._frames) == 1:
             raise RuntimeError("Can not pop() the base context frame.")
         self._frames.pop()
+        self._flattened = None
 
     def __getitem__(self, key):
-        return self._frames[-1][key]
+        flattened = self._flattened
+        if flattened is None:
+            flattened = self._settings()
+        return flattened[key]
 
     def __setitem__(self, key, value):
         if key not in self:
             raise KeyError("%r not permitted in this %s" % (
                 key, self.__class__.__name__))
+        # settings are part of the keys plans and fragments are cached by
+        if type(value) is list:
+            value = tuple(value)
+        else:
+            try:
+                hash(value)
+            except TypeError:
+                raise TypeError("%r must be hashable, not %s" % (
+                    key, type(value).__name__))
         self._frames[-1][key] = value
+        if self._flattened is not None:
+            # the top frame masks every frame below it
+            self._flattened[key] = value
 
     def __contains__(self, key):
-        return key in self._frames[-1]
+        # the base frame holds every permitted key
+        return key in self._frames[0]
 
     def update(self, *iterable, **kwargs):
         if len(iterable):
@@ -65,10 +184,26 @@ class Context(object):
             for key, value in source:
                 self[key] = value
         for key, value in kwargs.items():
-            self[key.decode('ascii')] = value
+            self[key] = value
+
+    def _settings(self):
+        """All settings in effect, as one mapping in base frame order.
+
+        Built by walking the frames once and kept, without copying settings
+        into the frames, until a frame is popped.  Must not be modified.
+
+        """
+        flattened = self._flattened
+        if flattened is None:
+            frames = self._frames
+            flattened = dict(frames[0])
+            for frame in frames[1:]:
+                flattened.update(frame)
+            self._flattened = flattened
+        return flattened
 
     def __repr__(self):
-        return "%s(%r)" % (self.__class__.__name__, self._frames[-1])
+        return "%s(%r)" % (self.__class__.__name__, self._settings())
 
 
 class Markup(str):
@@ -87,6 +222,8 @@ def transformer(name, tags):
     def decorator(fn):
         _transforms.append(fn)
         _auto_tags[name] = set(tags)
+        _toggles[fn] = ('auto_' + name, _auto_tags[name])
+        _plans.clear()
         return fn
     return decorator
 
@@ -248,6 +385,19 @@ def transform_filters(tagname, attributes, contents, context, bind):
     return contents
 
 _transforms.append(transform_filters)
+_toggles[transform_filters] = ('auto_filter', None)
+# transform_domid is registered as 'id' but toggled by 'auto_domid'
+_toggles[transform_domid] = ('auto_domid', _auto_tags['id'])
+
+# transforms that ignore tag contents, other than transform_value on
+# _contents_tags
+_contents_blind = frozenset((transform_name, transform_value,
+                             transform_domid, transform_for,
+                             transform_tabindex))
+_contents_tags = frozenset(('option', 'textarea'))
+# transforms whose output depends only on their arguments
+_pure_transforms = frozenset((transform_name, transform_value,
+                              transform_domid, transform_for))
 
 
 def _pop_toggle(key, attributes, context):
@@ -298,23 +448,3 @@ def _sanitize_domid_suffix(string):
     """
     # as this is suffix only, no need to test string[0] for validity
     return _id_invalid_re.sub('', string)
-
-
-def _unpack(html_string):
-    """Extract HTML unicode from a __html__() interface."""
-    unpacked = html_string.__html__()
-    if unpacked.__class__ is str:
-        return unpacked
-    return str(unpacked)
-
-
-def _markup_escape(string):
-    if not string:
-        return ''
-    elif hasattr(string, '__html__'):
-        return _unpack(string)
-    else:
-        return string. \
-               replace('&', '&amp;'). \
-               replace('<', '&lt;'). \
-               replace('>', '&gt;')
@@ -1,7 +1,7 @@
 
-from collections import deque
+from itertools import chain
 
-from genshi.core import Namespace, QName, END, START, TEXT
+from genshi.core import Attrs, Namespace, QName, END, START, TEXT
 from genshi.template.base import (
     DirectiveFactory,
     EXPR,
@@ -14,14 +14,15 @@ from genshi.template.directives import Directive
 from genshi.template.interpolation import interpolate
 
 
-from flatland.out.generic import _unpack, transform, Context
+from flatland.out.escape import _unpack
+from flatland.out.generic import _uses_contents, transform, Context
 
 
 __all__ = ('setup',)
 
 NS = Namespace('http://ns.discorporate.us/flatland/genshi')
 
-_static_attribute_order = ['type', 'name', 'value']
+_static_attribute_order = {'type': 0, 'name': 1, 'value': 2}
 
 _to_context = {}
 for key in ('auto-name', 'auto-value', 'auto-domid', 'auto-for',
@@ -44,21 +45,37 @@ def setup(template):
 
 
 class EvaluatedLast(Directive):
-    __slots__ = ()
+    # _analyses holds what this directive works out about the tags it is
+    # applied to; directives live as long as their compiled template.
+    __slots__ = ('_chain', '_analyses')
 
     def __call__(self, stream, directives, ctxt, **vars):
-        local, foreign = [], []
-        for d in directives:
-            if isinstance(d, EvaluatedLast):
-                local.append(d)
-            else:
-                foreign.append(d)
+        key = tuple(directives)
+        try:
+            chain_key, local, foreign = self._chain
+        except AttributeError:
+            chain_key = None
+        if chain_key != key:
+            local, foreign = [], []
+            for d in directives:
+                if isinstance(d, EvaluatedLast):
+                    local.append(d)
+                else:
+                    foreign.append(d)
+            self._chain = key, local, foreign
         if foreign:
-            foreign.append(self)
-            foreign.extend(local)
-            return foreign[0](stream, foreign[1:], ctxt, **vars)
+            chained = foreign + [self] + local
+            return chained[0](stream, chained[1:], ctxt, **vars)
         return self.process(stream, local, ctxt, vars)
 
+    @property
+    def analyses(self):
+        try:
+            return self._analyses
+        except AttributeError:
+            self._analyses = analyses = {}
+            return analyses
+
     def process(self, stream, directives, ctxt, vars):
         raise NotImplementedError  # pragma: nocover
 
@@ -117,7 +134,8 @@ class ControlAttribute(AttributeOnly):
             directives = [self]
         else:
             directives = [self] + directives
-        return _rewrite_stream(stream, directives, ctxt, vars, None)
+        return _rewrite_stream(stream, directives, ctxt, vars, None,
+                               self.analyses)
 
     def inject(self, mapping, ctxt, vars):
         """Inject the translated key and interpolated value into *mapping*."""
@@ -183,7 +201,8 @@ class Binding(AttributeOnly):
             bind = None
         else:
             bind = _eval_expr(self.expr, ctxt, vars)
-        return _rewrite_stream(stream, directives, ctxt, vars, bind)
+        return _rewrite_stream(stream, directives, ctxt, vars, bind,
+                               self.analyses)
 
 
 class RenderContextManipulator(TagOnly):
@@ -203,7 +222,16 @@ class RenderContextManipulator(TagOnly):
 
 class With(RenderContextManipulator):
     _name = 'with'
-    __slots__ = ()
+    __slots__ = ('filters',)
+
+    def __init__(self, attributes, template=None, namespaces=None,
+                 lineno=-1, offset=-1):
+        RenderContextManipulator.__init__(self, attributes, template,
+                                          namespaces, lineno, offset)
+        if 'filters' in self.attributes:
+            self.filters = Expression(self.attributes['filters'])
+        else:
+            self.filters = None
 
     def process(self, stream, directives, ctxt, vars):
         try:
@@ -211,12 +239,11 @@ class With(RenderContextManipulator):
         except KeyError:
             ctxt['flatland_render_context'] = render_context = Context()
 
-        if 'filters' not in self.attributes:
+        if self.filters is None:
             attrs = self.attributes
         else:
             attrs = self.attributes.copy()
-            attrs['filters'] = _eval_expr(Expression(attrs['filters']),
-                                          ctxt, vars)
+            attrs['filters'] = _eval_expr(self.filters, ctxt, vars)
 
         render_context.push()
         render_context.update(attrs)
@@ -257,103 +284,194 @@ class FlatlandElements(DirectiveFactory):
         ]
 
 
-def _rewrite_stream(stream, directives, ctxt, vars, bind):
-    stream = list(stream)
-    mutable_attrs = {}
+def _rewrite_stream(stream, directives, ctxt, vars, bind, analyses):
+    stream = iter(stream)
+    start = next(stream)
+    tag = _analyze_tag(start, directives, analyses)
 
-    for control_attribute in directives:
+    mutable_attrs = tag.controls.copy()
+    for control_attribute in tag.dynamic_controls:
         control_attribute.inject(mutable_attrs, ctxt, vars)
-
-    kind, (tagname, attrs), pos = stream[0]
-    if len(stream) == 2:
-        contents = None
-    else:
-        contents = _simplify_stream(stream[1:-1], ctxt, vars)
-
-    existing_attributes = {}
-    for qname, value in attrs:
-        if qname.namespace is None:
-            if not isinstance(value, str):
-                value = _simplify_stream(value, ctxt, vars)
-                attrs |= ((qname, value),)
-            existing_attributes[qname.localname] = qname
-            mutable_attrs[qname.localname] = value
+    mutable_attrs.update(tag.attributes)
+    for name, value in tag.dynamic_attributes:
+        mutable_attrs[name] = _simplify_stream(list(value), ctxt, vars)
 
     try:
         render_context = ctxt['flatland_render_context']
     except KeyError:
         ctxt['flatland_render_context'] = render_context = Context()
 
-    new_contents = transform(tagname.localname, mutable_attrs, contents,
+    # only collect the contents if a transform will look at them; otherwise
+    # the rest of the stream, end tag included, passes through untouched.
+    if _uses_contents(tag.localname, mutable_attrs, render_context):
+        body = list(stream)
+        end = body.pop()
+        if body:
+            contents = _simplify_stream(body, ctxt, vars)
+        else:
+            contents = None
+        tail = (end,)
+    else:
+        body, contents, tail = stream, None, ()
+
+    new_contents = transform(tag.localname, mutable_attrs, contents,
                              render_context, bind)
 
-    if new_contents is None:
-        new_contents = ()
-    elif isinstance(new_contents, str):
+    if isinstance(new_contents, str):
         new_contents = [(TEXT, new_contents, (None, -1, -1))]
-
-    pairs = sorted(iter(mutable_attrs.items()), key=_attribute_sort_key)
+    if new_contents:
+        if not tail:
+            # replacing streamed contents: find the end tag
+            for event in body:
+                tail = (event,)
+        body = new_contents
+
+    final = []
+    for qname, name, value in tag.order:
+        if name is not None:
+            value = mutable_attrs.get(name)
+            if value is None:
+                continue
+        final.append((qname, value))
+    existing = tag.existing
+    pairs = sorted([(name, value) for name, value in mutable_attrs.items()
+                    if value is not None and name not in existing],
+                   key=_attribute_sort_key)
     for attribute_name, value in pairs:
-        if attribute_name in existing_attributes:
-            qname = existing_attributes.pop(attribute_name)
+        final.append((QName(attribute_name), value))
+    kind, (tagname, attrs), pos = start
+    head = kind, (tagname, Attrs(final)), pos
+
+    if tag.option is not None and bind is not None:
+        binding = Binding('', bind=bind)
+        if not new_contents:
+            # the options are template events; share their analyses
+            binding._analyses = tag.options
+        body = _bind_unbound_tags(body, tag.option, binding)
+    return chain((head,), body, tail)
+
+
+def _analyze_tag(start, directives, analyses):
+    """Return the :class:`_TagAnalysis` of *start* under *directives*.
+
+    Analyses are cached in *analyses* by the template position of the start
+    event, one for each position.  Genshi reuses a parsed template's events
+    from render to render; events built afresh, as by ``py:attrs``, are
+    compared by value and replace the analysis at their position.
+
+    """
+    kind, data, pos = start
+    key = tuple(directives)
+    try:
+        cached_data, cached_key, tag = analyses[pos]
+        if ((cached_data is data or cached_data == data) and
+            cached_key == key):
+            return tag
+    except KeyError:
+        pass
+    tag = _TagAnalysis(start, directives)
+    analyses[pos] = data, key, tag
+    return tag
+
+
+class _TagAnalysis(object):
+    """The parts of a bound tag's rendering that are the same every time.
+
+    Control attributes and tag attributes with literal values are resolved
+    here, once; only the interpolated ones are evaluated for each render.
+
+    """
+
+    __slots__ = ('localname', 'controls', 'dynamic_controls', 'attributes',
+                 'dynamic_attributes', 'existing', 'order', 'option',
+                 'options')
+
+    def __init__(self, start, directives):
+        kind, (tagname, attrs), pos = start
+        self.localname = tagname.localname
+        self.controls = {}
+        self.dynamic_controls = []
+        for control_attribute in directives:
+            if control_attribute.raw_value.__class__ is str:
+                control_attribute.inject(self.controls, None, None)
+            else:
+                self.dynamic_controls.append(control_attribute)
+
+        self.attributes = {}
+        self.dynamic_attributes = []
+        self.existing = set()
+        self.order = []
+        for qname, value in attrs:
+            if qname.namespace is None:
+                name = qname.localname
+                if isinstance(value, str):
+                    self.attributes[name] = value
+                else:
+                    self.dynamic_attributes.append((name, value))
+                self.existing.add(name)
+                self.order.append((qname, name, None))
+            else:
+                self.order.append((qname, None, value))
+
+        if self.localname != 'select':
+            self.option = self.options = None
         else:
-            qname = QName(attribute_name)
-        attrs |= ((qname, value),)
-    for qname in list(existing_attributes.values()):
-        attrs -= qname
-
-    stream[0] = (kind, (tagname, attrs), pos)
-    if new_contents and tagname.localname == 'select' and bind is not None:
-        if tagname.namespace:
-            sub_tag = Namespace(tagname.namespace).option
-        else:  # pragma: nocover
-            sub_tag = QName('option')
-        new_contents = _bind_unbound_tags(new_contents, sub_tag, bind)
-    if new_contents:
-        stream[1:-1] = new_contents
-    return iter(stream)
+            if tagname.namespace:
+                self.option = Namespace(tagname.namespace).option
+            else:  # pragma: nocover
+                self.option = QName('option')
+            self.options = {}
 
 
 def _attribute_sort_key(item):
-    try:
-        return (0, _static_attribute_order.index(item[0]))
-    except ValueError:
-        return (1, item[0])
+    key = item[0]
+    if key in _static_attribute_order:
+        return (0, _static_attribute_order[key])
+    return (1, key)
 
 
-def _bind_unbound_tags(stream, qname, bind):
-    stream = deque(stream)
-    while stream:
-        kind, data, pos = stream.popleft()
+def _bind_unbound_tags(stream, qname, binding):
+    """Bind the *qname* tags of *stream* that lack a binding.
+
+    Each such tag and its contents are wrapped in the :class:`Binding`
+    directive *binding*.  Tags nested inside a wrapped tag are wrapped too,
+    in the same pass.
+
+    """
+    # open wrapped tags: [events, nested qname tags still open, pos]
+    open_tags = []
+    for event in stream:
+        kind, data, pos = event
         if kind is SUB:
             directives, substream = data
             for d in directives:  # pragma: nocover   (coverage bug :()
                 if isinstance(d, Binding):
                     break
             else:
-                substream = list(_bind_unbound_tags(substream, qname, bind))
-            yield kind, (directives, substream), pos
-        elif kind is START:
-            if data[0] != qname or qname in data[1]:
-                yield kind, data, pos
+                # directives may run a substream more than once, keep a list
+                substream = list(_bind_unbound_tags(substream, qname,
+                                                    binding))
+                event = kind, (directives, substream), pos
+        elif kind is START and data[0] == qname:
+            if qname not in data[1]:
+                open_tags.append([[event], 0, pos])
                 continue
-            head = kind, data, pos
-            substream = []
-            stack = 1
-            while stack:
-                event = stream.popleft()
-                substream.append(event)
-                if event[0] is START and event[1][0] == qname:
-                    stack += 1
-                elif event[0] is END and event[1] == qname:
-                    stack -= 1
-            substream = [head] + list(
-                _bind_unbound_tags(substream, qname, bind))
-            # attaching the directive is sufficient; don't need to fabricate
-            # a form:bind="" attribute
-            yield SUB, ([Binding('', bind=bind)], substream), pos
+            elif open_tags:
+                open_tags[-1][1] += 1
+        elif kind is END and data == qname and open_tags:
+            wrapped = open_tags[-1]
+            if wrapped[1]:
+                wrapped[1] -= 1
+            else:
+                open_tags.pop()
+                wrapped[0].append(event)
+                # attaching the directive is sufficient; don't need to
+                # fabricate a form:bind="" attribute
+                event = SUB, ([binding], wrapped[0]), wrapped[2]
+        if open_tags:
+            open_tags[-1][0].append(event)
         else:
-            yield kind, data, pos
+            yield event
 
 
 def _simplify_stream(stream, ctxt, vars):
@@ -372,6 +490,7 @@ def _simplify_stream(stream, ctxt, vars):
                     value = _simplify_stream(value, ctxt, vars)
                 if not isinstance(value, str):
                     stream[idx:idx + 1] = value
+                    return stream
                 else:
                     stream[idx] = (TEXT, value, pos)
             elif not isinstance(value, str):
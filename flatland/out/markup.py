@@ -1,23 +1,36 @@
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from threading import Lock
 
-from flatland.out.generic import Context, transform, _unpack
+from flatland.out.escape import escape_attribute, escape_text, _unpack
+from flatland.out.generic import Context, transform, _cacheable
 from flatland.out.util import parse_trool
+from flatland.schema import (
+    Boolean,
+    Compound,
+    Container,
+    Enum,
+    Mapping,
+    Scalar,
+    )
 
 
 _default_settings = {'ordered_attributes': True}
-_static_attribute_order = ['type', 'name', 'value']
+_static_attribute_order = {'type': 0, 'name': 1, 'value': 2}
 
 
 class Generator(Context):
     """General XML/HTML tag generator"""
 
-    def __init__(self, markup='xhtml', **settings):
+    def __init__(self, markup='xhtml', fragment_cache=None, **settings):
         """Create a generator.
 
         Accepts any :ref:`markupsettings`, as well as the following:
 
         :param markup: tag output style: 'xml', 'xhtml' or 'html'
 
+        :param fragment_cache: optional, a :class:`FragmentCache` to reuse
+          complete tags from.  May be shared between generators.
+
         :param ordered_attributes: if True (default), output markup attributes
           in a predictable order.  Useful for tests and generally a little
           more pleasant to read.
@@ -30,6 +43,7 @@ class Generator(Context):
             self.xml = True
         else:
             raise TypeError("Unknown markup type %r" % markup)
+        self.fragment_cache = fragment_cache
         self._tags = defaultdict(list)
         self._frames[-1].update(_default_settings)
         self.push()
@@ -201,6 +215,47 @@ class Generator(Context):
         else:
             return self._tag(tagname)(bind, **attributes)
 
+    def stream(self, bind, chunk_size=8192, **settings):
+        """Generate markup for *bind* and all of its children, in chunks.
+
+        :param bind: a flatland element.
+        :param chunk_size: the approximate length of each chunk.
+        :param \*\*settings: :ref:`markupsettings` in effect for the
+          generated markup, as with :meth:`begin`.
+        :returns: an iterator of markup strings
+
+        Walks the element tree depth-first, rendering the markup for each
+        element as it is reached and handing it out once a chunk's worth
+        has been collected.  The first chunk is available long before a
+        large form is fully rendered, and memory use does not grow with the
+        size of the form, so the iterator can be returned directly as a
+        WSGI response body or fed to a file's ``writelines()``::
+
+          out.writelines(generator.stream(form, auto_domid=True))
+
+        Containers are wrapped in ``<fieldset>`` tags, :class:`Boolean`
+        elements are rendered as checkboxes, :class:`Enum` elements as
+        ``<select>`` tags with an ``<option>`` per valid value, and other
+        scalars as text inputs.  A scalar
+        with a :attr:`~Element.label` other than its name is preceded by a
+        ``<label>``.  Each tag is generated as by :meth:`tag`, with the
+        usual attribute transformations applied.
+
+        The settings are pushed when iteration starts and popped when it
+        ends, and are seen by any other tags generated in between.
+
+        """
+        return _chunked(self._stream(bind, settings), chunk_size,
+                        self['markup_wrapper'])
+
+    def _stream(self, bind, settings):
+        self.push(**settings)
+        try:
+            for markup in _stream_element(self, bind):
+                yield markup
+        finally:
+            self.pop()
+
     def _tag(self, tagname, empty_in_html=False, always_paired=False):
         if self._tags[tagname]:
             return self._tags[tagname][-1]
@@ -268,11 +323,11 @@ class Tag(object):
         self.contents = self._markup(new_contents)
 
         if self._context['ordered_attributes']:
-            pairs = sorted(list(attributes.items()), key=_attribute_sort_key)
+            pairs = sorted(attributes.items(), key=_attribute_sort_key)
         else:
             pairs = iter(attributes.items())
-        guts = ' '.join('%s="%s"' % (k, _attribute_escape(v))
-                         for k, v in pairs)
+        guts = ' '.join(['%s="%s"' % (k, escape_attribute(v))
+                         for k, v in pairs])
         if guts:
             return '<' + tagname + ' ' + guts
         else:
@@ -286,6 +341,24 @@ class Tag(object):
 
     def __call__(self, bind=None, **attributes):
         """Return a complete, closed markup string."""
+        cache = self._context.fragment_cache
+        if cache is not None:
+            key = _fragment_key(self, bind, attributes)
+            if key is not None:
+                try:
+                    fragment = cache.get(key)
+                except TypeError:
+                    # an unhashable attribute value; settings are kept
+                    # hashable by Context
+                    return self._render(bind, attributes)
+                if fragment is None:
+                    fragment = self._render(bind, attributes), self.contents
+                    cache.add(key, fragment)
+                markup, self.contents = fragment
+                return markup
+        return self._render(bind, attributes)
+
+    def _render(self, bind, attributes):
         header = self._open(bind, attributes)
         contents = self.contents
         if not contents:
@@ -302,29 +375,169 @@ class Tag(object):
         return self()
 
 
-def _attribute_escape(string):
-    if not string:
-        return ''
-    elif hasattr(string, '__html__'):
-        return _unpack(string)
+class FragmentCache(object):
+    """A bounded, least-recently-used cache of rendered tags.
+
+    Given to a :class:`Generator`, complete tags (but not the halves from
+    :meth:`~Tag.open` and :meth:`~Tag.close`) are reused when generated
+    again with the same attributes and contents, bound element name, type
+    and value, and :ref:`markupsettings`.  Tags whose rendering depends on
+    more than that are always generated: tags bound to containers, tags
+    numbered with a positive ``tabindex``, tags with a per-tag setting
+    such as ``auto_domid``, and tags passed through filters that are not
+    marked ``cacheable``::
+
+      def uppercase(tagname, attributes, contents, context, bind):
+          ...
+      uppercase.cacheable = True
+
+    :param maxsize: the number of tags to retain.  ``None`` removes the
+      bound.
+
+    :param maxchars: the total length of the markup to retain.  ``None``
+      removes the bound.
+
+    """
+
+    def __init__(self, maxsize=1024, maxchars=1 << 20):
+        self.maxsize = maxsize
+        self.maxchars = maxchars
+        self.chars = 0
+        self.hits = self.misses = self.evictions = 0
+        self._fragments = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._fragments)
+
+    def __contains__(self, key):
+        return key in self._fragments
+
+    def get(self, key):
+        """Return the (markup, contents) cached for *key*, or None."""
+        with self._lock:
+            try:
+                fragment = self._fragments[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._fragments.move_to_end(key)
+            return fragment
+
+    def add(self, key, fragment):
+        """Cache *fragment*, a (markup, contents) pair, for *key*."""
+        with self._lock:
+            previous = self._fragments.pop(key, None)
+            if previous is not None:
+                self.chars -= len(previous[0])
+            self._fragments[key] = fragment
+            self.chars += len(fragment[0])
+            self._trim()
+
+    def clear(self):
+        """Empty the cache and reset its counters."""
+        with self._lock:
+            self._fragments.clear()
+            self.chars = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """Return a mapping of the cache's counters and current size."""
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._fragments),
+                'maxsize': self.maxsize,
+                'chars': self.chars,
+                'maxchars': self.maxchars}
+
+    def _trim(self):
+        fragments = self._fragments
+        while fragments and (
+            self.maxsize is not None and len(fragments) > self.maxsize or
+            self.maxchars is not None and self.chars > self.maxchars):
+            key, fragment = fragments.popitem(last=False)
+            self.chars -= len(fragment[0])
+            self.evictions += 1
+
+
+def _fragment_key(tag, bind, attributes):
+    """Return the cache key for a complete *tag*, or None if uncacheable."""
+    if isinstance(bind, Container):
+        # rendering may read every member, as with 'in' on an Array
+        return None
+    context = tag._context
+    if not _cacheable(tag.tagname, attributes, context):
+        return None
+    if bind is not None:
+        value = bind.u
+        bind = type(bind), bind.flattened_name(), type(value), value
+    # values are keyed with their type: a Markup value and a string of the
+    # same text are equal, but only the string is escaped
+    attributes = tuple([(key, type(value), value)
+                        for key, value in attributes.items()])
+    settings = tuple(context._settings().values())
+    return tag.tagname, context.xml, bind, attributes, settings
+
+
+def _stream_element(generator, bind):
+    # Compounds are edited through their children; other scalar containers
+    # such as MultiValue are edited as one value
+    if (isinstance(bind, Compound) or
+        isinstance(bind, Container) and not isinstance(bind, Scalar)):
+        fieldset = generator.tag('fieldset')
+        yield fieldset.open(bind)
+        if isinstance(bind, Mapping):
+            # schema order, materializing lazy children one at a time
+            children = (bind[field.name] for field in bind.field_schema
+                        if field.name in bind)
+        else:
+            children = bind.children
+        for child in children:
+            for markup in _stream_element(generator, child):
+                yield markup
+        yield fieldset.close()
+        return
+
+    if bind.label != bind.name:
+        yield generator.label(bind, contents=escape_text(bind.label))
+    if isinstance(bind, Boolean):
+        yield generator.input(bind, type='checkbox')
+    elif isinstance(bind, Enum):
+        select = generator.select
+        yield select.open(bind)
+        option = generator.option
+        for value in bind.valid_values:
+            text = bind.serialize(value)
+            yield option(bind, value=text, contents=escape_text(text))
+        yield select.close()
     else:
-        return string. \
-               replace('&', '&amp;'). \
-               replace('<', '&lt;'). \
-               replace('>', '&gt;'). \
-               replace('"', '&quot;')
+        yield generator.input(bind, type='text')
+
+
+def _chunked(pieces, size, wrapper):
+    buffered, length = [], 0
+    for piece in pieces:
+        buffered.append(piece)
+        length += len(piece)
+        if length >= size:
+            yield wrapper(''.join(buffered))
+            buffered, length = [], 0
+    if buffered:
+        yield wrapper(''.join(buffered))
 
 
 def _unicode_keyed(bytestring_keyed):
     rekeyed = {}
     for key, value in list(bytestring_keyed.items()):
-        as_unicode = key.rstrip('_').decode('ascii')
+        as_unicode = key.rstrip('_')
         rekeyed[as_unicode] = value
     return rekeyed
 
 
 def _attribute_sort_key(item):
-    try:
-        return (0, _static_attribute_order.index(item[0]))
-    except ValueError:
-        return (1, item[0])
+    key = item[0]
+    if key in _static_attribute_order:
+        return (0, _static_attribute_order[key])
+    return (1, key)
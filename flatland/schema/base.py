@@ -2,6 +2,8 @@
 import collections
 import itertools
 import operator
+from types import MappingProxyType
+
 from flatland.schema.paths import pathexpr
 from flatland.schema.properties import Properties
 from flatland.signals import validator_validated
@@ -59,6 +61,47 @@ class _BaseElement(object):
     pass
 
 
+class _messages(object):
+    """A per-instance message list, allocated on first use.
+
+    A non-data descriptor: the first read stores a list on the element, and
+    from then on normal attribute lookup finds it and this descriptor is
+    bypassed.  Elements whose messages are never read or written hold no
+    list at all.
+
+    """
+
+    def __init__(self, attribute):
+        self.attribute = attribute
+
+    def __get__(self, instance, cls):
+        if instance is None:
+            return self
+        messages = instance.__dict__[self.attribute] = []
+        return messages
+
+
+def _tracked(attribute, doc):
+    """Return a property for *attribute* that marks the element when set.
+
+    The value is kept in the plain attribute ``_<attribute>``, which is read
+    directly from C, so reads cost little more than a plain attribute's.
+
+    """
+    storage = '_' + attribute
+
+    def set(self, value):
+        setattr(self, storage, value)
+        # as Element._mark_dirty, which this is called too often to go through
+        if self._validation is not None:
+            self._validation = None
+        parent = self.parent
+        while parent is not None and not parent._dirty_children:
+            parent._dirty_children = True
+            parent = parent.parent
+    return property(operator.attrgetter(storage), set, doc=doc)
+
+
 class Element(_BaseElement):
     """Base class for form fields.
 
@@ -121,17 +164,41 @@ class Element(_BaseElement):
     properties = Properties()
     """A mapping of arbitrary data associated with the element."""
 
+    parent = None
+    """The element's parent element, or None for a root element."""
+
+    valid = Unevaluated
+    """The result of the most recent :meth:`validate`."""
+
+    _validation = None
+    # (descent result, tree validity) of the last validation; None if the
+    # element has changed since or was never validated.
+
+    _dirty_children = False
+    # True if a descendant has changed since the last validation.
+
+    errors = _messages('errors')
+    """A list of validation error messages.
+
+    The list is allocated on first use: elements without errors share no
+    per-instance storage for it.
+    """
+
+    warnings = _messages('warnings')
+    """A list of validation warning messages.
+
+    The list is allocated on first use, as for :attr:`errors`.
+    """
+
     flattenable = False
     children_flattenable = True
     validates_down = None
     validates_up = None
 
     def __init__(self, value=Unspecified, **kw):
-        self.parent = kw.pop('parent', None)
-
-        self.valid = Unevaluated
-        self.errors = []
-        self.warnings = []
+        parent = kw.pop('parent', None)
+        if parent is not None:
+            self.parent = parent
 
         # FIXME This (and 'using') should also do descent_validators
         # via lookup - or don't copy at all
@@ -150,6 +217,24 @@ class Element(_BaseElement):
         if value is not Unspecified:
             self.set(value)
 
+    @classmethod
+    def compile(cls):
+        """Return the frozen :class:`SchemaPlan` for this schema.
+
+        The plan is built on first use and kept on the class.  Field lookups
+        by :class:`~flatland.Mapping` elements, including those of
+        :meth:`set` and :meth:`set_flat`, consult it rather than re-deriving
+        the same data from the class on each call.  It is rebuilt
+        automatically if ``field_schema`` is later reassigned or has fields
+        added or removed, see :meth:`SchemaPlan.is_current`.
+
+        """
+        plan = cls.__dict__.get('_schema_plan')
+        if plan is None or not plan.is_current():
+            plan = SchemaPlan(cls)
+            cls._schema_plan = plan
+        return plan
+
     @class_cloner
     def named(cls, name):
         """Return a class with ``name`` = *name*
@@ -391,7 +476,6 @@ class Element(_BaseElement):
         while element is not None:
             yield element
             element = element.parent
-        raise StopIteration()
 
     @property
     def path(self):
@@ -453,29 +537,42 @@ class Element(_BaseElement):
           u'.0'
 
         """
-        if self.parent is None:
+        names = self.__dict__.get('_names')
+        if names is None:
+            names = self._names = {}
+        key = ('fq', sep)
+        try:
+            return names[key]
+        except KeyError:
+            pass
+        parent = self.parent
+        if parent is None:
+            names[key] = sep
             return sep
 
-        children_of_root = reversed(list(self.parents)[:-1])
-
-        parts, mask = [], None
-        for element in list(children_of_root) + [self]:
-            # allow Slot elements to mask the names of their child
-            # e.g.
-            #     <List name='l'> <Slot name='0'> <String name='s'>
-            # has an .el()/Python path of just
-            #   l.0
-            # not
-            #   l.0.s
-            if isinstance(element, Slot):
-                mask = element.name
-                continue
-            elif mask:
-                parts.append(mask)
-                mask = None
-                continue
-            parts.append(element.name)
-        return sep + sep.join(parts)
+        # allow Slot elements to mask the names of their child
+        # e.g.
+        #     <List name='l'> <Slot name='0'> <String name='s'>
+        # has an .el()/Python path of just
+        #   l.0
+        # not
+        #   l.0.s
+        if isinstance(self, Slot):
+            name = names[key] = parent.fq_name(sep)
+            return name
+        if isinstance(parent, Slot):
+            name, parent = parent.name, parent.parent
+        else:
+            name = self.name
+        # going through the parent's fq_name caches it there too, so that
+        # _invalidate_names finds this name from the top down
+        prefix = parent.fq_name(sep)
+        if parent.parent is None:
+            name = prefix + name
+        else:
+            name = prefix + sep + name
+        names[key] = name
+        return name
 
     def find(self, path, single=False, strict=True):
         """Find child elements by string path.
@@ -523,10 +620,11 @@ class Element(_BaseElement):
 
         """
         expr = pathexpr(path)
-        results = expr(self, strict)
         if not single:
-            return results
-        elif not results:
+            return expr(self, strict)
+        # two results are enough to know there is more than one
+        results = list(itertools.islice(expr.iterfind(self, strict), 2))
+        if not results:
             return None
         elif len(results) > 1 and strict:
             raise LookupError("Path %r matched multiple elements; single "
@@ -534,6 +632,24 @@ class Element(_BaseElement):
         else:
             return results[0]
 
+    def iterfind(self, path, strict=True):
+        """Iterate over child elements found by string path.
+
+        :param path: a path, as for :meth:`find`.
+
+        :param strict: defaults to True.  If *path* specifies children that
+          do not exist, a :exc:`LookupError` is raised when the iteration
+          reaches them.
+
+        :returns: an iterator of :class:`Element` instances, in the order
+          :meth:`find` would list them.
+
+        Elements are located as the iterator advances, so iteration can stop
+        as soon as the wanted elements are found.
+
+        """
+        return pathexpr(path).iterfind(self, strict)
+
     def el(self, path, sep='.'):
         """Find a child element by string path.
 
@@ -615,13 +731,29 @@ class Element(_BaseElement):
 
     def add_error(self, message):
         "Register an error message on this element, ignoring duplicates."
-        if message not in self.errors:
-            self.errors.append(message)
+        errors = self.__dict__.get('errors')
+        if errors is None:
+            self.errors = [message]
+        elif message not in errors:
+            errors.append(message)
 
     def add_warning(self, message):
         "Register a warning message on this element, ignoring duplicates."
-        if message not in self.warnings:
-            self.warnings.append(message)
+        warnings = self.__dict__.get('warnings')
+        if warnings is None:
+            self.warnings = [message]
+        elif message not in warnings:
+            warnings.append(message)
+
+    def has_errors(self):
+        "True if this element has error messages.  Allocates no list."
+        return bool(self.__dict__.get('errors'))
+
+    def clear_messages(self):
+        "Remove this element's error and warning messages."
+        instance = self.__dict__
+        instance.pop('errors', None)
+        instance.pop('warnings', None)
 
     def flattened_name(self, sep='_'):
         """Return the element's complete flattened name as a string.
@@ -630,6 +762,10 @@ class Element(_BaseElement):
         qualified, flattened name.  Encodes all :class:`Container` and other
         structures into a single string.
 
+        The name is cached on the element.  Containers discard the cached
+        names of elements they adopt or renumber; assigning :attr:`name`
+        directly on an element does not.
+
         Example::
 
           >>> import flatland
@@ -643,9 +779,44 @@ class Element(_BaseElement):
           u'addresses_0_address'
 
         """
-        return sep.join(parent.name
-                        for parent in self.path
-                        if parent.name is not None)
+        name = self._flattened_name(sep)
+        return '' if name is None else name
+
+    def _flattened_name(self, sep):
+        """The cached flattened name, or None if no element is named."""
+        names = self.__dict__.get('_names')
+        if names is None:
+            names = self._names = {}
+        try:
+            return names[sep]
+        except KeyError:
+            pass
+        if self.parent is None:
+            name = self.name
+        else:
+            name = _join_flattened(self.parent._flattened_name(sep),
+                                   self.name, sep)
+        names[sep] = name
+        return name
+
+    def _invalidate_names(self):
+        """Forget the cached names of this element and its children.
+
+        Called when the element is reparented or renamed.  Names are cached
+        top-down, so an element without cached names has no children with
+        cached names either.  Slots are the exception: the fully qualified
+        names of their children skip over them.
+
+        """
+        if (self.__dict__.pop('_names', None) is None and
+                not isinstance(self, Slot)):
+            return
+        for child in self.children:
+            parent = child.parent
+            if parent is not self and parent is not None:
+                # a Slot between the container and its child
+                parent.__dict__.pop('_names', None)
+            child._invalidate_names()
 
     def flatten(self, sep='_', value=operator.attrgetter('u')):
         """Export an element hierarchy as a flat sequence of key, value pairs.
@@ -687,16 +858,63 @@ class Element(_BaseElement):
           [(u'contact_name', u'')]
 
         """
+        name = self._flattened_name(sep)
         if self.flattenable:
-            pairs = [(self.flattened_name(sep), value(self))]
+            pairs = [(name or '', value(self))]
         else:
             pairs = []
-        if self.children_flattenable:
-            pairs.extend((e.flattened_name(sep), value(e))
-                         for e in self.all_children
-                         if e.flattenable)
+        if not self.children_flattenable:
+            return pairs
+
+        # build names top-down rather than walking each element's path
+        queue = collections.deque([(self, name)])
+        while queue:
+            parent, name = queue.popleft()
+            for child in parent.children:
+                child_name = _child_flattened_name(parent, name, child, sep)
+                if child.flattenable:
+                    pairs.append((child_name or '', value(child)))
+                queue.append((child, child_name))
         return pairs
 
+    def iterflatten(self, sep='_', value=operator.attrgetter('u')):
+        """Iterate over the flattened pairs of an element hierarchy.
+
+        Yields the same ``(name, value)`` pairs as :meth:`flatten`, but one
+        at a time and depth-first: each element is followed by all of its
+        children before its next sibling.  Only the current branch of the
+        tree is held in memory, so very large trees can be streamed into a
+        CSV writer or chunked response without building the full list.
+
+          >>> from flatland import Dict, String
+          >>> class Nested(Form):
+          ...     contact = Dict.of(String.named(u'name'),
+          ...                       Dict.named(u'address').\
+          ...                            of(String.named(u'email')))
+          ...
+          >>> element = Nested()
+          >>> list(element.iterflatten())
+          [(u'contact_name', u''), (u'contact_address_email', u'')]
+
+        """
+        name = self._flattened_name(sep)
+        if self.flattenable:
+            yield name or '', value(self)
+        if not self.children_flattenable:
+            return
+
+        stack = [(self, name, iter(self.children))]
+        while stack:
+            parent, name, children = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                continue
+            child_name = _child_flattened_name(parent, name, child, sep)
+            if child.flattenable:
+                yield child_name or '', value(child)
+            stack.append((child, child_name, iter(child.children)))
+
     def set(self, value):
         """Assign the native and Unicode value.
 
@@ -745,10 +963,16 @@ class Element(_BaseElement):
         Given a sequence of name/value tuples or a dict, build out a
         structured tree of value elements.
 
+        *pairs* is consumed in a single pass and may be a one-shot iterator,
+        such as the rows of a CSV reader.  Containers route each pair
+        directly to the element it names rather than copying the pairs at
+        each level of the tree.
+
         """
         self.raw = Unset
+        self._mark_dirty()
         if hasattr(pairs, 'items'):
-            pairs = list(pairs.items())
+            pairs = pairs.items()
 
         return self._set_flat(pairs, sep)
 
@@ -764,7 +988,7 @@ class Element(_BaseElement):
         """True if the element has no value."""
         return True if (self.value is None and self.u == '') else False
 
-    def validate(self, state=None, recurse=True):
+    def validate(self, state=None, recurse=True, incremental=False):
         """Assess the validity of this element and its children.
 
         :param state: optional, will be passed unchanged to all validator
@@ -773,6 +997,9 @@ class Element(_BaseElement):
         :param recurse: if False, do not validate children.  :returns: True or
           False
 
+        :param incremental: if True, revalidate only what has changed since
+          the last validation.  See :ref:`incremental-validation`.
+
         Iterates through this element and all of its children, invoking each
         element's :meth:`schema.validate_element`.  Each element will be
         visited twice: once heading down the tree, breadth-first, and again
@@ -782,6 +1009,8 @@ class Element(_BaseElement):
 
         """
         if not recurse:
+            # the children's results, and so this element's, are unknown
+            self._mark_dirty()
             down = self._validate(state, True)
             if down is Unevaluated:
                 self.valid = down
@@ -795,53 +1024,70 @@ class Element(_BaseElement):
                 self.valid = bool(up)
             return self.valid
 
-        valid = True
-        elements, seen, queue = [], set(), collections.deque([self])
+        if incremental:
+            return _validate_incremental(self, state, _compiled_validation())
+        return _validate_tree(self, state, _compiled_validation())
 
-        # descend breadth first, skipping any branches that return All*
-        while queue:
-            element = queue.popleft()
-            if id(element) in seen:
-                continue
-            seen.add(id(element))
-            elements.append(element)
-            validated = element._validate(state, True)
+    def _mark_dirty(self):
+        """Note a change to this element for incremental validation.
 
-            if validated is Unevaluated:
-                element.valid = validated
-            else:
-                element.valid = bool(validated)
-                if valid:
-                    valid &= validated
-            if validated is SkipAll or validated is SkipAllFalse:
-                continue
-            queue.extend(element.children)
+        The element's own validators will run again on the next
+        ``validate(incremental=True)``, as will the ascent validators of all
+        of its parents.
+
+        """
+        if self._validation is not None:
+            self._validation = None
+        parent = self.parent
+        while parent is not None and not parent._dirty_children:
+            parent._dirty_children = True
+            parent = parent.parent
 
-        # back up, visiting only the elements that weren't skipped above
-        for element in reversed(elements):
-            validated = element._validate(state, False)
+    @classmethod
+    def validate_many(cls, elements, state=None):
+        """Validate a batch of elements of this schema.
 
-            # an Unevaluated ascent validator does not override the results
-            # of descent validation
-            if validated is Unevaluated:
-                pass
-            elif element.valid:
-                element.valid = bool(validated)
-                if valid:
-                    valid &= validated
-        return bool(valid)
+        :param elements: an iterable of instances of this schema.
+
+        :param state: optional, will be passed unchanged to all validator
+          callables.
+
+        :returns: a :class:`ValidationResults`
+
+        Each element is validated as by :meth:`validate`.  Work that depends
+        only on the schema, such as resolving each element type's validator
+        chains, is done once for the whole batch rather than once per
+        element.
+
+        """
+        validate = _compiled_validation()
+        results = []
+        for element in elements:
+            if not isinstance(element, cls):
+                raise TypeError("validate_many() expected %s elements, "
+                                "got %r" % (cls.__name__, element))
+            results.append(_validate_tree(element, state, validate))
+        return ValidationResults(results)
 
     def _validate(self, state, descending):
         """Run validation, transforming None into success. Internal."""
-        if descending:
-            if self.validates_down:
-                validators = getattr(self, self.validates_down, None)
-                return validate_element(self, state, validators)
-        else:
-            if self.validates_up:
-                validators = getattr(self, self.validates_up, None)
-                return validate_element(self, state, validators)
-        return Unevaluated
+        validators = self._validation_chain(descending)
+        if validators is Unevaluated:
+            return Unevaluated
+        return validate_element(self, state, validators)
+
+    def _validation_chain(self, descending):
+        """Return the validators for one validation pass. Internal.
+
+        Returns :obj:`Unevaluated` if the pass is not evaluated at all.  The
+        result must depend only on the element's schema attributes: batch
+        validation reuses it for all elements of the same type.
+
+        """
+        attribute = self.validates_down if descending else self.validates_up
+        if not attribute:
+            return Unevaluated
+        return getattr(self, attribute, None)
 
     @property
     def default_value(self):
@@ -886,6 +1132,353 @@ class Slot(object):
     """Marks a semi-visible Element-holding Element, like the 0 in list[0]."""
 
 
+class SchemaPlan(object):
+    """A frozen, precomputed summary of an :class:`Element` class.
+
+    Obtained from :meth:`Element.compile`.  Attributes:
+
+    ``schema``
+      The Element class the plan describes.
+
+    ``fields``
+      A tuple of the class's ``field_schema``, in order.  Empty for
+      schemas without named children.
+
+    ``field_index``
+      A read-only mapping of field name to field schema.
+
+    """
+
+    __slots__ = ('schema', 'field_schema', 'fields', 'field_index',
+                 '_derived')
+
+    def __init__(self, schema):
+        self.schema = schema
+        self._derived = {}
+
+        self.field_schema = getattr(schema, 'field_schema', ())
+        self.fields = tuple(self.field_schema)
+        index = {}
+        for field in self.fields:
+            index.setdefault(field.name, field)
+        self.field_index = MappingProxyType(index)
+
+    def is_current(self):
+        """True if the schema's fields have not changed since the plan was built.
+
+        Notices ``field_schema`` being reassigned, and fields being added to
+        or removed from it in place.  Replacing a field in the middle of the
+        list in place is not noticed; reassign ``field_schema`` instead.
+
+        """
+        field_schema = getattr(self.schema, 'field_schema', ())
+        return (field_schema is self.field_schema and
+                _same_fields(field_schema, self.fields))
+
+    def derived(self, key, factory, *args):
+        """Return ``factory(*args)``, computed once per plan for *key*."""
+        try:
+            return self._derived[key]
+        except KeyError:
+            value = self._derived[key] = factory(*args)
+            return value
+
+
+def _same_fields(field_schema, fields):
+    """True if *field_schema* appears unchanged from the tuple *fields*.
+
+    A constant time check, run on every field lookup: compares the length
+    and the first and last fields.
+
+    """
+    size = len(fields)
+    if len(field_schema) != size:
+        return False
+    return not size or (field_schema[0] is fields[0] and
+                        field_schema[-1] is fields[-1])
+
+
+class ValidationResults(object):
+    """The outcome of :meth:`Element.validate_many`.
+
+    A sequence of booleans, one per validated element, in input order.
+    Aggregate counts are available as :attr:`valid` and :attr:`invalid`.
+
+    """
+
+    __slots__ = 'results', 'valid', 'invalid'
+
+    def __init__(self, results):
+        self.results = results
+        self.valid = results.count(True)
+        self.invalid = len(results) - self.valid
+
+    def __len__(self):
+        return len(self.results)
+
+    def __iter__(self):
+        return iter(self.results)
+
+    def __getitem__(self, index):
+        return self.results[index]
+
+    def __bool__(self):
+        return not self.invalid
+
+    def __repr__(self):
+        return '<ValidationResults valid=%d invalid=%d>' % (
+            self.valid, self.invalid)
+
+
+def _join_flattened(name, child_name, sep):
+    """Join flattened names, either of which may be None if unnamed."""
+    if child_name is None:
+        return name
+    if name is None:
+        return child_name
+    return name + sep + child_name
+
+
+def _child_flattened_name(parent, name, child, sep):
+    """Extend *parent*'s flattened *name* to *child*, through any Slot."""
+    slot = child.parent
+    if slot is not parent and slot is not None:
+        name = _join_flattened(name, slot.name, sep)
+    return _join_flattened(name, child.name, sep)
+
+
+def _validate_one(element, state, descending):
+    return element._validate(state, descending)
+
+
+def _validate_tree(root, state, validate):
+    """Validate *root* and its children, as for :meth:`Element.validate`.
+
+    *validate* is called as ``validate(element, state, descending)`` to run
+    each element's validators for one pass.
+
+    """
+    valid = True
+    elements, seen, queue = [], set(), collections.deque([root])
+
+    # descend breadth first, skipping any branches that return All*
+    while queue:
+        element = queue.popleft()
+        if id(element) in seen:
+            continue
+        seen.add(id(element))
+        elements.append(element)
+        validated = validate(element, state, True)
+        element._validation = (validated, None)
+
+        if validated is Unevaluated:
+            element.valid = validated
+        else:
+            element.valid = bool(validated)
+            if valid:
+                valid &= validated
+        if validated is SkipAll or validated is SkipAllFalse:
+            continue
+        queue.extend(element.children)
+
+    # back up, visiting only the elements that weren't skipped above
+    for element in reversed(elements):
+        validated = validate(element, state, False)
+        if element._dirty_children:
+            element._dirty_children = False
+
+        # an Unevaluated ascent validator does not override the results
+        # of descent validation
+        if validated is Unevaluated:
+            pass
+        elif element.valid:
+            element.valid = bool(validated)
+            if valid:
+                valid &= validated
+    return bool(valid)
+
+
+def _validate_incremental(element, state, validate):
+    """Revalidate the changed parts of *element*'s tree.
+
+    Returns the validity of the tree, as :func:`_validate_tree` would.  The
+    validators of dirty elements are run again, as are the ascent validators
+    of their ancestors.  Everywhere else the results of the last validation,
+    kept in ``element._validation`` as a ``(descent result, tree validity)``
+    pair, are reused.
+
+    """
+    record = element._validation
+    changed = element._dirty_children
+    if record is not None:
+        if not changed and record[1] is not None:
+            return record[1]
+        validated = record[0]
+    else:
+        validated = validate(element, state, True)
+        changed = True
+
+    if changed:
+        if validated is Unevaluated:
+            element.valid = validated
+        else:
+            element.valid = bool(validated)
+
+    valid = True
+    if validated is not SkipAll and validated is not SkipAllFalse:
+        for child in element.children:
+            if not _validate_incremental(child, state, validate):
+                valid = False
+
+    if changed:
+        up = validate(element, state, False)
+        # an Unevaluated ascent validator does not override the results
+        # of descent validation
+        if up is not Unevaluated and element.valid:
+            element.valid = bool(up)
+
+    valid = valid and bool(element.valid)
+    element._validation = (validated, valid)
+    if element._dirty_children:
+        element._dirty_children = False
+    return valid
+
+
+def _compiled_validation():
+    """Return a ``validate(element, state, descending)`` for one run.
+
+    Elements are validated through the per-type runners of
+    :func:`_type_runner`.  Whether
+    :obj:`~flatland.signals.validator_validated` is emitted is decided once,
+    here, for the whole run.
+
+    """
+    traced = bool(validator_validated.receivers)
+    attribute = '_traced_validation_runner' if traced else '_validation_runner'
+
+    def validate(element, state, descending):
+        cls = type(element)
+        runner = getattr(cls, attribute, None)
+        if runner is None or runner.schema is not cls:
+            runner = _type_runner(cls, traced, attribute)
+        return runner(element, state, descending)
+    return validate
+
+
+def _type_runner(cls, traced, attribute):
+    """Create the validation runner for elements of type *cls*.
+
+    The runner applies the type's validator chains, compiled once by
+    :func:`compile_validators` and recompiled if the type's chains are
+    reassigned or changed in place.  Elements with instance-level chains are validated by
+    :func:`validate_element`, as are all elements of types with a custom
+    :meth:`Element._validate`.  The runner is stored on the type as
+    *attribute*.
+
+    """
+    if cls._validate is not Element._validate:
+        def run(element, state, descending):
+            return element._validate(state, descending)
+    else:
+        overrides = tuple(set(('validates_down', 'validates_up',
+                               cls.validates_down or 'validates_down',
+                               cls.validates_up or 'validates_up')))
+        # descending -> (chain, compiled chain)
+        compiled = {True: (None, None), False: (None, None)}
+
+        def run(element, state, descending):
+            validators = element._validation_chain(descending)
+            chain, fn = compiled[descending]
+            # a list may be changed in place: compare a snapshot of it
+            if isinstance(validators, list):
+                current = tuple(validators)
+            else:
+                current = validators
+            if current is not chain and current != chain:
+                instance = element.__dict__
+                for name in overrides:
+                    if name in instance:
+                        if validators is Unevaluated:
+                            return Unevaluated
+                        return validate_element(element, state, validators)
+                fn = compile_validators(current, traced)
+                compiled[descending] = (current, fn)
+            return fn(element, state)
+    run.schema = cls
+    setattr(cls, attribute, staticmethod(run))
+    return run
+
+
+def _unevaluated(element, state):
+    return Unevaluated
+
+
+def compile_validators(validators, traced=False):
+    """Compile *validators* into a single ``run(element, state)`` function.
+
+    The result of ``run`` is that of :func:`validate_element` for the same
+    *validators*.  Each :class:`~flatland.validation.Validator` that does
+    not customize ``__call__`` is bound directly to its ``validate``
+    method.  :obj:`~flatland.signals.validator_validated` is emitted only
+    if *traced* is true.
+
+    """
+    if validators is Unevaluated:
+        return _unevaluated
+    if not validators:
+        def run(element, state):
+            empty = element.is_empty
+            if empty and element.optional:
+                return True
+            if traced:
+                validator_validated.send(
+                    NotEmpty, element=element, state=state, result=not empty)
+            return not empty
+        return run
+
+    bound = tuple((fn, _bind_validator(fn)) for fn in validators)
+    if traced:
+        def run(element, state):
+            if element.is_empty and element.optional:
+                return True
+            for fn, call in bound:
+                valid = call(element, state)
+                validator_validated.send(
+                    fn, element=element, state=state, result=valid)
+                if valid is None:
+                    return False
+                elif valid is Skip:
+                    return True
+                elif not valid or valid is SkipAll:
+                    return valid
+            return True
+        return run
+
+    calls = tuple(call for fn, call in bound)
+
+    def run(element, state):
+        if element.is_empty and element.optional:
+            return True
+        for call in calls:
+            valid = call(element, state)
+            if valid is None:
+                return False
+            elif valid is Skip:
+                return True
+            elif not valid or valid is SkipAll:
+                return valid
+        return True
+    return run
+
+
+def _bind_validator(fn):
+    """Skip the ``Validator.__call__`` indirection where it adds nothing."""
+    from flatland.validation.base import Validator
+    if isinstance(fn, Validator) and type(fn).__call__ is Validator.__call__:
+        return fn.validate
+    return fn
+
+
 def validate_element(element, state, validators):
     """Apply a set of validators to an element.
 
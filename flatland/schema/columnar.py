@@ -0,0 +1,192 @@
+"""Column-oriented ingestion of flat records."""
+from flatland.schema.parallel import error_summary
+from flatland.schema.scalars import Scalar
+
+
+__all__ = ['ColumnarBatch', 'adapt_columns']
+
+
+def adapt_columns(schema, columns, sep='_', validate=False, state=None):
+    """Adapt tabular records a column at a time.
+
+    :param schema: an :class:`~flatland.Element` class, typically a
+      :class:`~flatland.Form` or :class:`~flatland.Dict` of scalar fields.
+
+    :param columns: a mapping of flattened names, as used by
+      :meth:`~flatland.Element.set_flat`, to sequences of raw values with
+      one item per record.  Lists, tuples and NumPy arrays may be used.
+      All columns must be of the same length.
+
+    :param sep: the separator used by the flattened names.
+
+    :param validate: if true, also validate every record that adapted
+      cleanly.  See below.
+
+    :param state: optional, passed to all validator callables.
+
+    :returns: a :class:`ColumnarBatch`
+
+    Each column is adapted with a single call to the
+    :meth:`~flatland.Scalar.adapt_many` of its field, rather than one
+    :meth:`~flatland.Scalar.set` per record.  Records with a value that
+    could not be adapted are marked invalid in :attr:`ColumnarBatch.valid`.
+    Blank values, ``None`` or strings of whitespace, are the exception: as
+    with :meth:`~flatland.Scalar.set` their native value is ``None``, and
+    it is left to validation to accept or reject them.
+
+    With *validate*, the remaining records are validated one at a time.
+    Each record's values are loaded into a single element tree that is
+    reused for all of them, so no per-record elements are created.  To
+    report errors, :meth:`ColumnarBatch.element` and
+    :meth:`ColumnarBatch.errors` build an element tree for a single record.
+
+    Only :class:`~flatland.Scalar` fields with the standard
+    :meth:`~flatland.Scalar.set` may be given as columns.  Other fields,
+    and fields without a column, keep their default values.
+
+    """
+    scratch = schema()
+    leaves = dict(scratch.iterflatten(sep, value=lambda element: element))
+    size = None
+    for name, column in columns.items():
+        leaf = leaves.get(name)
+        if leaf is None:
+            raise KeyError('%s has no field flattened as %r' % (
+                schema.__name__, name))
+        if not isinstance(leaf, Scalar) or type(leaf).set is not Scalar.set:
+            raise TypeError('column %r is a %s, not a Scalar field' % (
+                name, type(leaf).__name__))
+        if size is None:
+            size = len(column)
+        elif len(column) != size:
+            raise ValueError('column %r has %d values, expected %d' % (
+                name, len(column), size))
+
+    batch = ColumnarBatch(schema, sep, columns, size or 0, leaves)
+    for name, column in columns.items():
+        natives, failed = leaves[name].adapt_many(column)
+        batch.columns[name] = natives
+        batch.failed[name] = failed
+        for row in failed:
+            if not _blank(column[row]):
+                batch.valid[row] = False
+    if validate:
+        batch._validate(scratch, state)
+    return batch
+
+
+class ColumnarBatch(object):
+    """Adapted columns and per-record validity, from :func:`adapt_columns`.
+
+    Records are addressed by their row index in the input columns.
+    Attributes:
+
+    ``raw``
+      The input columns, by flattened name.
+
+    ``columns``
+      Lists of native values, by flattened name.  Values that could not be
+      adapted are ``None``.
+
+    ``failed``
+      Lists of the rows that could not be adapted, by flattened name.
+
+    ``valid``
+      A list of booleans, one per record.
+
+    """
+
+    __slots__ = ('schema', 'sep', 'raw', 'columns', 'failed', 'valid',
+                 '_leaves')
+
+    def __init__(self, schema, sep, raw, size, leaves):
+        self.schema = schema
+        self.sep = sep
+        self.raw = raw
+        self.columns = {}
+        self.failed = {}
+        self.valid = [True] * size
+        self._leaves = leaves
+
+    def __len__(self):
+        return len(self.valid)
+
+    @property
+    def invalid_rows(self):
+        """A list of the rows of invalid records."""
+        return [row for row, valid in enumerate(self.valid) if not valid]
+
+    def serialized(self, name):
+        """Return the column *name* as :attr:`~flatland.Element.u` strings.
+
+        Each string is what :meth:`~flatland.Scalar.set` would store for
+        the record's raw value.
+
+        """
+        column, natives = self.raw[name], self.columns[name]
+        serialized = self._leaves[name].serialize_many(natives)
+        for row in self.failed[name]:
+            serialized[row] = _unadapted_u(column[row])
+        return serialized
+
+    def element(self, row):
+        """Build the element tree of the record at *row*."""
+        element = self.schema()
+        element.set_flat(((name, column[row])
+                          for name, column in self.raw.items()), self.sep)
+        return element
+
+    def elements(self, rows=None):
+        """Iterate over ``(row, element)`` pairs.
+
+        :param rows: the rows to build elements for.  Defaults to
+          :attr:`invalid_rows`.
+
+        """
+        if rows is None:
+            rows = self.invalid_rows
+        for row in rows:
+            yield row, self.element(row)
+
+    def errors(self, row, state=None):
+        """Validate the record at *row* and summarize its errors.
+
+        :returns: a mapping as for
+          :func:`~flatland.schema.parallel.error_summary`.
+
+        """
+        element = self.element(row)
+        element.validate(state)
+        return error_summary(element, self.sep)
+
+    def _validate(self, scratch, state):
+        elements = [scratch]
+        elements.extend(scratch.all_children)
+        leaves = self._leaves
+        loaded = [(leaves[name], self.raw[name], natives,
+                   self.serialized(name))
+                  for name, natives in self.columns.items()]
+        valid = self.valid
+        for row in range(len(valid)):
+            if not valid[row]:
+                continue
+            for element in elements:
+                element.clear_messages()
+            for leaf, raw, natives, serialized in loaded:
+                leaf.raw = raw[row]
+                leaf.value = natives[row]
+                leaf.u = serialized[row]
+            valid[row] = scratch.validate(state)
+
+
+def _blank(value):
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
+def _unadapted_u(value):
+    # as Scalar.set, for a value that failed adaptation
+    if value is None:
+        return ''
+    elif isinstance(value, str):
+        return value
+    return str(value)
@@ -159,6 +159,7 @@ class Compound(Mapping, Scalar, metaclass=_MetaCompound):
     del set_value
 
     def set(self, value):
+        self._mark_dirty()
         try:
             # TODO: historically explode() did not need to have a return value
             # but it would be nice to return it form set() as below.
@@ -288,6 +289,7 @@ class JoinedString(Array, String):
     children_flattenable = False
 
     def set(self, value):
+        self._mark_dirty()
         if isinstance(value, (list, tuple)):
             values = value
         elif not isinstance(value, str):
@@ -1,6 +1,6 @@
 # -*- coding: utf-8; fill-column: 78 -*-
-from collections import defaultdict
-import re
+import heapq
+from types import MappingProxyType
 
 from flatland.util import (
     Unspecified,
@@ -8,10 +8,16 @@ from flatland.util import (
     autodocument_from_superclasses,
     class_cloner,
     keyslice_pairs,
-    re_uescape,
     to_pairs,
     )
-from flatland.schema.base import Element, Unevaluated, Slot, validate_element
+from flatland.schema.base import (
+    Element,
+    Slot,
+    Unevaluated,
+    Unset,
+    _same_fields,
+    validate_element,
+    )
 from flatland.schema.scalars import Scalar
 
 
@@ -117,21 +123,12 @@ class Container(Element):
         else:
             return validate_element(element, state, self.validators)
 
-    def _validate(self, state, descending):
-        """Run validation, transforming None into success. Internal."""
-        # FIXME: refactor this to allow for this logic ("Don't apply default
-        # validation on downward pass") to be defined declaratively.
-        if descending:
-            if self.validates_down:
-                validators = getattr(self, self.validates_down, None)
-                if not validators:
-                    return Unevaluated
-                return validate_element(self, state, validators)
-        else:
-            if self.validates_up:
-                validators = getattr(self, self.validates_up, None)
-                return validate_element(self, state, validators)
-        return Unevaluated
+    def _validation_chain(self, descending):
+        validators = Element._validation_chain(self, descending)
+        # Don't apply default validation on the downward pass.
+        if descending and not validators:
+            return Unevaluated
+        return validators
 
 
 class Sequence(Container, list):
@@ -246,6 +243,7 @@ class Sequence(Container, list):
 
         """
 
+        self._mark_dirty()
         del self[:]
         self.raw = iterable
         values, converted = [], True
@@ -294,7 +292,9 @@ class Sequence(Container, list):
         if not isinstance(value, Element):
             value = self.member_schema(value=value)
         value.parent = self
+        value._invalidate_names()
         list.append(self, value)
+        self._mark_dirty()
 
     def extend(self, iterable):
         """Append *iterable* values to the end.
@@ -316,7 +316,9 @@ class Sequence(Container, list):
         if not isinstance(value, Element):
             value = self.member_schema(value=value)
         value.parent = self
+        value._invalidate_names()
         list.insert(self, index, value)
+        self._mark_dirty()
 
     def __setitem__(self, index, value):
         if isinstance(index, slice):
@@ -325,6 +327,7 @@ class Sequence(Container, list):
                 if not isinstance(item, Element):
                     item = self.member_schema(value=item)
                 item.parent = self
+                item._invalidate_names()
                 as_elements.append(item)
             value = as_elements
         else:
@@ -332,10 +335,20 @@ class Sequence(Container, list):
                 value = self.member_schema(value=value)
                 value.parent = self
         list.__setitem__(self, index, value)
+        self._mark_dirty()
 
     def __setslice__(self, i, j, value):
         self.__setitem__(slice(i, j), value)
 
+    def __delitem__(self, index):
+        list.__delitem__(self, index)
+        self._mark_dirty()
+
+    def pop(self, index=-1):
+        value = list.pop(self, index)
+        self._mark_dirty()
+        return value
+
     def remove(self, value):
         """Remove member with value *value*.
 
@@ -347,6 +360,15 @@ class Sequence(Container, list):
         if not isinstance(value, Element):
             value = self.member_schema(value=value)
         list.remove(self, value)
+        self._mark_dirty()
+
+    def sort(self, *args, **kwargs):
+        list.sort(self, *args, **kwargs)
+        self._mark_dirty()
+
+    def reverse(self):
+        list.reverse(self)
+        self._mark_dirty()
 
     def index(self, value):
         """Return first index of *value*.
@@ -392,7 +414,7 @@ class Sequence(Container, list):
     def u(self):
         return '[%s]' % ', '.join(
             element.u if isinstance(element, Container)
-                      else repr(element.u).decode('raw_unicode_escape')
+                      else repr(element.u)
             for element in self.children)
 
 
@@ -413,6 +435,11 @@ class ListSlot(Container, Slot):
         self.parent = parent
         self.element = element
         element.parent = self
+        element._invalidate_names()
+
+    @property
+    def children(self):
+        return iter((self.element,))
 
     @property
     def u(self):
@@ -463,7 +490,7 @@ class List(Sequence):
 
     def _new_slot(self, value=Unspecified):
         """Wrap *value* in a Slot named as the element's index in the list."""
-        return self.slot_type(name=str(len(self)).decode('ascii'),
+        return self.slot_type(name=str(len(self)),
                               parent=self,
                               element=self._as_element(value))
 
@@ -474,6 +501,7 @@ class List(Sequence):
 
     def append(self, value):
         list.append(self, self._new_slot(value))
+        self._mark_dirty()
 
     def extend(self, iterable):
         for v in iterable:
@@ -492,6 +520,7 @@ class List(Sequence):
             value = [self._new_slot(item) for item in value]
             list.__setitem__(self, index, value)
             self._renumber()
+            self._mark_dirty()
         else:
             slot = self[index]
             slot.set(value)
@@ -508,6 +537,7 @@ class List(Sequence):
         # doesn't seem worth it.
         list.__delitem__(self, index)  # slices ok
         self._renumber()
+        self._mark_dirty()
 
     def __delslice__(self, i, j):
         return self.__delitem__(slice(i, j))
@@ -515,87 +545,67 @@ class List(Sequence):
     def pop(self, index=-1):
         value = list.pop(self, index)
         self._renumber()
+        self._mark_dirty()
         value.parent = None
+        value._invalidate_names()
         return value
 
     def insert(self, index, value):
         list.insert(self, index, self._new_slot(value))
         self._renumber()
+        self._mark_dirty()
 
     def remove(self, value):
         list.remove(self, self._as_element(value))
         self._renumber()
+        self._mark_dirty()
 
     def sort(self, cmp=None, key=None, reverse=False):
         list.sort(self, cmp, key, reverse)
         self._renumber()
+        self._mark_dirty()
 
     def reverse(self):
         list.reverse(self)
         self._renumber()
+        self._mark_dirty()
 
     def _renumber(self):
         for idx, slot in enumerate(self._slots):
-            slot.name = str(idx).decode('ascii')
+            name = str(idx)
+            if slot.name != name:
+                slot.name = name
+                slot._invalidate_names()
 
     @property
     def children(self):
         return iter(child.element for child in self._slots)
 
     def _set_flat(self, pairs, sep):
-        del self[:]
-
-        if not pairs:
-            return
-
-        if self.name:
-            regex = re.compile(r'^%s(\d+)(?:%s|$)' % (
-                re_uescape(self.name + sep), re_uescape(sep)), re.UNICODE)
-        else:
-            regex = re.compile(r'^(\d+)(?:%s|$)' % (
-                re_uescape(sep)), re.UNICODE)
-
-        indexes = defaultdict(list)
-        prune = self.prune_empty
-
+        ingest = _FlatIngest(sep)
+        ingest.members(self)
         for key, value in pairs:
-            if value == '' and prune:
-                continue
-            m = regex.match(key)
-            if not m:
-                continue
-            try:
-                index = int(m.group(1))
-            except TypeError:
-                # Ignore keys with outrageously large indexes- they
-                # aren't valid data for us.
-                pass
-            else:
-                child_key = key[len(m.group(0)):] or None
-                indexes[index].append((child_key, value))
+            self._ingest_flat(key, 0, value, ingest)
+        ingest.finish()
 
-        if not indexes:
+    def _ingest_flat(self, key, start, value, ingest):
+        """Route one flat pair, *key* starting at offset *start*."""
+        members = ingest.members(self)
+        if value == '' and self.prune_empty:
             return
-
-        # lossy: missing (or empty-valued) indexes are omitted.
-        #        the python indexes may not match the flat indexes
-        if prune:
-            for offset, index in enumerate(sorted(indexes)):
-                if offset == self.maximum_set_flat_members:
-                    break
-                slot = self._new_slot()
-                list.append(self, slot)
-                slot.element.set_flat(indexes[index], sep)
-        # lossless: elements are built up to the highest seen index or a
-        #           schema-configured maximum. flat + python indexes match.
-        else:
-            max_index = min(max(indexes) + 1, self.maximum_set_flat_members)
-            for index in range(0, max_index):
-                slot = self._new_slot()
-                list.append(self, slot)
-                flat = indexes.get(index, None)
-                if flat:
-                    slot.element.set_flat(flat, sep)
+        sep = ingest.sep
+        name = self.name
+        if name:
+            if not (key.startswith(name, start) and
+                    key.startswith(sep, start + len(name))):
+                return
+            start += len(name) + len(sep)
+        split = _split_flat_index(key, start, sep)
+        if split is None:
+            return
+        member = members.get(split[0])
+        if member is not None:
+            ingest.feed(member, key, split[1], value)
 
     def set_default(self):
         """set() the element to the schema default.
@@ -663,13 +673,16 @@ class Array(Sequence):
                 member = self.member_schema.from_flat([(key, value)])
                 self.append(member)
         else:
-            regex = re.compile(r'^(%s(?:%s|$))' % (
-                re_uescape(self.name), re_uescape(sep)), re.UNICODE)
+            name = self.name
+            prefix = name + sep
+            plen = len(prefix)
             for key, value in pairs:
-                m = regex.match(key)
-                if not m:
+                if key == name:
+                    remainder = None
+                elif key.startswith(prefix):
+                    remainder = key[plen:] or None
+                else:
                     continue
-                remainder = key[m.end():] or None
                 if child_name and not remainder:
                     continue
                 elif prune and value == '' and remainder == child_name:
@@ -678,6 +691,29 @@ class Array(Sequence):
                 self.append(member)
 
 
+def _split_flat_index(key, start, sep):
+    """Parse a ``<digits>[<sep><rest>]`` flat key from offset *start*.
+
+    :returns: a 2-tuple of integer index and the offset of the child key in
+      *key* (``len(key)`` if there is no remainder), or ``None`` if *key* does
+      not begin with an index.
+
+    """
+    cut = key.find(sep, start)
+    if cut == -1:
+        digits, child_start = key[start:], len(key)
+    else:
+        digits, child_start = key[start:cut], cut + len(sep)
+    if not digits.isdecimal():
+        return None
+    try:
+        return int(digits), child_start
+    except ValueError:
+        # Ignore keys with outrageously large indexes- they aren't valid
+        # data for us.
+        return None
+
+
 class MultiValue(Array, Scalar):
     """A transparent homogeneous Container, for multivalued form elements.
 
@@ -735,6 +771,19 @@ class Mapping(Container, dict):
     field_schema = ()
     """TODO: doc field_schema"""
 
+    lazy_children = False
+    """If true, defer creating child elements until they are first needed.
+
+    A lazy mapping is created empty.  Each child is instantiated on first
+    access by key (``el['x']``, :meth:`~flatland.schema.base.Element.find`,
+    :meth:`set`, :meth:`set_flat`), and all remaining children are
+    instantiated, in :attr:`field_schema` order, when the mapping is iterated,
+    copied or printed or its :attr:`children`, :attr:`value` or :attr:`u` are
+    read.  Untouched fields hold fresh elements, exactly as they would if
+    created eagerly.  Default ``False``.
+
+    """
+
     def __init__(self, value=Unspecified, **kw):
         Container.__init__(self, **kw)
         if not self.field_schema:
@@ -750,6 +799,21 @@ class Mapping(Container, dict):
                             (key, type(self).__name__, self.name))
         self[key].set(value)
 
+    def __missing__(self, key):
+        if self.lazy_children:
+            schema = self._field_schema_for(key)
+            if schema is not None:
+                child = schema(parent=self)
+                dict.__setitem__(self, key, child)
+                return child
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        if dict.__contains__(self, key):
+            return True
+        return bool(self.lazy_children and
+                    self._field_schema_for(key) is not None)
+
     def __delitem__(self, key):
         # this may be overly pedantic
         if key not in self:
@@ -763,13 +827,84 @@ class Mapping(Container, dict):
     def clear(self):
         raise TypeError('%s keys are immutable.' % type(self).__name__)
 
+    _materialized = False
+    # True once a lazy mapping holds all of its children in field order.
+
     def _reset(self):
         """Place blank children in all fields."""
+        if self.lazy_children:
+            dict.clear(self)
+            self._materialized = False
+            return
         for member_schema in self.field_schema:
             key = member_schema.name
             dict.__setitem__(
                 self, key, member_schema(parent=self))
 
+    def _materialize(self):
+        """Create any children deferred by :attr:`lazy_children`.
+
+        Children are placed in :attr:`field_schema` order, whatever order
+        they were first accessed in.
+
+        """
+        if self._materialized:
+            return
+        self._materialized = True
+        existing = dict(dict.items(self))
+        dict.clear(self)
+        for member_schema in self.field_schema:
+            key = member_schema.name
+            child = existing.get(key)
+            if child is None:
+                child = member_schema(parent=self)
+            dict.__setitem__(self, key, child)
+
+    def __iter__(self):
+        if self.lazy_children:
+            self._materialize()
+        return dict.__iter__(self)
+
+    def __len__(self):
+        if self.lazy_children:
+            return len(self.field_schema)
+        return dict.__len__(self)
+
+    def keys(self):
+        if self.lazy_children:
+            self._materialize()
+        return dict.keys(self)
+
+    def values(self):
+        if self.lazy_children:
+            self._materialize()
+        return dict.values(self)
+
+    def items(self):
+        if self.lazy_children:
+            self._materialize()
+        return dict.items(self)
+
+    def __reversed__(self):
+        if self.lazy_children:
+            self._materialize()
+        return dict.__reversed__(self)
+
+    def __or__(self, other):
+        if self.lazy_children:
+            self._materialize()
+        return dict.__or__(self, other)
+
+    def copy(self):
+        if self.lazy_children:
+            self._materialize()
+        return dict.copy(self)
+
+    def __repr__(self):
+        if self.lazy_children:
+            self._materialize()
+        return dict.__repr__(self)
+
     def popitem(self):
         raise TypeError('%s keys are immutable.' % type(self).__name__)
 
@@ -808,6 +943,7 @@ class Mapping(Container, dict):
 
     def set(self, value):
         """TODO: doc set()"""
+        self._mark_dirty()
         self.raw = value
         pairs = to_pairs(value)
         self._reset()
@@ -821,7 +957,7 @@ class Mapping(Container, dict):
                         type(self).__name__, self.name, key))
             converted &= self[key].set(value)
             seen.add(key)
-        required = set(self.keys())
+        required = set(self._field_index())
         if seen != required:
             missing = required - seen
             raise TypeError(
@@ -830,35 +966,66 @@ class Mapping(Container, dict):
         return converted
 
     def _set_flat(self, pairs, sep):
-        if self.name is None:
-            possibles = pairs  # accept all
-        else:
-            possibles = []
-            prefix = self.name + sep
-            plen = len(prefix)
-            for key, value in pairs:
-                if key == prefix:
-                    # No flat representation of mappings, ignore.
-                    pass
-                if key.startswith(prefix):
-                    # accept child element
-                    possibles.append((key[plen:], value))
-
-        if not possibles:
-            return
+        # Each key is walked once, left to right, through the prefix tries of
+        # this mapping and of the elements it routes into.  See _FlatIngest.
+        ingest = _FlatIngest(sep)
+        for key, value in pairs:
+            self._ingest_flat(key, 0, value, ingest)
+        ingest.finish()
+
+    def _ingest_flat(self, key, start, value, ingest):
+        """Route one flat pair, *key* starting at offset *start*."""
+        name = self.name
+        if name is not None:
+            # No flat representation of mappings, ignore key == name.
+            sep = ingest.sep
+            if not (key.startswith(name, start) and
+                    key.startswith(sep, start + len(name))):
+                return
+            start += len(name) + len(sep)
+        self._route_flat(key, start, value, ingest)
+
+    def _route_flat(self, key, start, value, ingest):
+        """Route a flat *key* from offset *start* to its owning child(ren).
 
-        for schema in self.field_schema:
-            field = schema.name
-            accum = []
-            for key, value in possibles:
-                if key.startswith(field):
-                    accum.append((key, value))
-            if accum:
-                if dict.__contains__(self, field):
-                    self[field].set_flat(accum, sep)
+        Follows the field name prefix trie one *sep*-delimited token at a
+        time.  A field owns the key if its name matches the key up to a
+        separator or the end of the key.  Nested :class:`Mapping` children
+        continue routing from the following token; all other children are
+        handed the key starting at their name, see :meth:`_FlatIngest.feed`.
+
+        """
+        sep = ingest.sep
+        node = ingest.trie(self)
+        slen = len(sep)
+        end = len(key)
+        pos = start
+        while pos <= end:
+            cut = key.find(sep, pos)
+            if cut == -1:
+                cut = end
+            node = node.children.get(key[pos:cut])
+            if node is None:
+                return
+            for schema in node.fields:
+                child = self._flat_child(schema)
+                if type(child)._set_flat is Mapping._set_flat:
+                    child.raw = Unset
+                    child._mark_dirty()
+                    if cut < end:
+                        child._route_flat(key, cut + slen, value, ingest)
                 else:
-                    self[field] = schema()
-                    self[field].set_flat(accum, sep=sep)
+                    ingest.feed(child, key, start, value)
+            pos = cut + slen
+
+    def _flat_child(self, schema):
+        """Return the child element for field *schema*, creating if needed."""
+        name = schema.name
+        try:
+            return dict.__getitem__(self, name)
+        except KeyError:
+            self[name] = schema()
+        return dict.__getitem__(self, name)
 
     def set_default(self):
         default = self.default_value
@@ -875,10 +1042,10 @@ class Mapping(Container, dict):
     def u(self):
         """A string repr of the element."""
         pairs = ((key, value.u if isinstance(value, Container)
-                               else repr(value.u).decode('raw_unicode_escape'))
+                               else repr(value.u))
                   for key, value in self.items())
         return '{%s}' % ', '.join(
-            "%s: %s" % (repr(k).decode('raw_unicode_escape'), v)
+            "%s: %s" % (repr(k), v)
             for k, v in pairs)
 
     @property
@@ -893,19 +1060,229 @@ class Mapping(Container, dict):
 
     @assignable_class_property
     def field_schema_mapping(instance, cls):
-        """A name -> schema mapping generated from :attr:`field_schema`."""
+        """A read-only name -> schema mapping of :attr:`field_schema`.
+
+        Computed once per schema class, or once per instance for elements
+        constructed with their own ``field_schema``, and recomputed if
+        ``field_schema`` is reassigned or has fields added or removed.
+
+        """
         if instance is not None:
-            field_schema = instance.field_schema
-        else:
-            field_schema = cls.field_schema
-        return dict((schema.name, schema) for schema in field_schema)
+            return instance._field_index()
+        return cls.compile().field_index
 
     def _field_schema_for(self, key):
         """Return the schema for field ``*key* or None."""
-        for schema in self.field_schema:
-            if schema.name == key:
-                return schema
-        return None
+        return self._field_index().get(key)
+
+    def _field_index(self):
+        """Return a read-only name -> schema mapping of this element's fields.
+
+        Elements using their class's ``field_schema`` share the index in the
+        class's compiled plan.  An instance-level ``field_schema`` gets an
+        index of its own, kept on the instance until ``field_schema`` is
+        reassigned or has fields added or removed, see
+        :meth:`~flatland.schema.base.SchemaPlan.is_current`.
+
+        """
+        field_schema = self.field_schema
+        plan = type(self).compile()
+        if field_schema is plan.field_schema:
+            return plan.field_index
+        cached = self.__dict__.get('_field_index_cache')
+        if (cached is None or cached[0] is not field_schema or
+            not _same_fields(field_schema, cached[1])):
+            index = {}
+            for schema in field_schema:
+                index.setdefault(schema.name, schema)
+            cached = (field_schema, tuple(field_schema),
+                      MappingProxyType(index))
+            self._field_index_cache = cached
+        return cached[2]
+
+
+class _FlatKeyNode(object):
+    """A node in a :class:`Mapping`'s flat key prefix trie."""
+
+    __slots__ = 'children', 'fields'
+
+    def __init__(self):
+        self.children = {}
+        self.fields = []
+
+
+def _flat_key_trie(element, sep):
+    """Return the root of the field name prefix trie for a Mapping element.
+
+    Tries are derived from :attr:`Mapping.field_schema`, split into tokens by
+    *sep*, and kept in the schema's compiled plan, one per separator.
+    Instances with a ``field_schema`` override get a freshly built, uncached
+    trie.
+
+    """
+    field_schema = element.field_schema
+    plan = type(element).compile()
+    if field_schema is not plan.field_schema:
+        return _build_flat_key_trie(field_schema, sep)
+    return plan.derived(('flat_key_trie', sep),
+                        _build_flat_key_trie, plan.fields, sep)
+
+
+def _build_flat_key_trie(field_schema, sep):
+    root = _FlatKeyNode()
+    for schema in field_schema:
+        if schema.name is None:
+            continue
+        node = root
+        for token in schema.name.split(sep):
+            child = node.children.get(token)
+            if child is None:
+                child = node.children[token] = _FlatKeyNode()
+            node = child
+        node.fields.append(schema)
+    return root
+
+
+class _FlatIngest(object):
+    """The state of one :meth:`~Element.set_flat` across an element tree.
+
+    Flat pairs are routed one at a time from the element ``set_flat`` was
+    called on down to the elements that own them: :class:`Mapping` and
+    :class:`List` elements pass each pair on to the right child, and
+    :class:`~flatland.schema.scalars.Scalar` elements take the first pair
+    naming them.  Nothing is buffered along the way, whatever the depth of
+    the tree.  Elements that only know how to take all of their pairs at
+    once, such as :class:`Array`, have them collected and are ``set_flat``
+    in :meth:`finish`, as are the members of each List.
+
+    """
+
+    __slots__ = 'sep', 'scalars', 'lists', 'collected', 'tries'
+
+    def __init__(self, sep):
+        self.sep = sep
+        self.scalars = {}
+        self.lists = {}
+        self.collected = {}
+        self.tries = {}
+
+    def trie(self, element):
+        """Return the flat key trie of Mapping *element*."""
+        field_schema = element.field_schema
+        cached = self.tries.get(type(element))
+        if cached is None or cached[0] is not field_schema:
+            cached = (field_schema, _flat_key_trie(element, self.sep))
+            self.tries[type(element)] = cached
+        return cached[1]
+
+    def feed(self, element, key, start, value):
+        """Route a pair to *element*; *key* starts at the element's name."""
+        set_flat = type(element)._set_flat
+        if set_flat is Mapping._set_flat or set_flat is List._set_flat:
+            element._ingest_flat(key, start, value, self)
+        elif set_flat is Scalar._set_flat:
+            self._set_scalar(element, key, start, value)
+        else:
+            collected = self.collected.get(id(element))
+            if collected is None:
+                collected = self.collected[id(element)] = (element, [])
+            collected[1].append((key[start:] or None, value))
+
+    def _set_scalar(self, element, key, start, value):
+        # as Scalar.set_flat: the first pair named for the element wins.
+        # entries hold the element so that its id is not reused mid-ingest.
+        seen = self.scalars.get(id(element))
+        if seen is None:
+            element.raw = Unset
+            element._mark_dirty()
+            seen = self.scalars[id(element)] = (element, False)
+        if seen[1]:
+            return
+        name = element.name
+        if name is None:
+            if start < len(key):
+                return
+        elif not (len(key) - start == len(name) and
+                  key.startswith(name, start)):
+            return
+        element.set(value)
+        self.scalars[id(element)] = (element, True)
+
+    def members(self, element):
+        """Return the member collector for List *element*."""
+        members = self.lists.get(id(element))
+        if members is None:
+            del element[:]
+            element.raw = Unset
+            element._mark_dirty()
+            members = self.lists[id(element)] = _FlatMembers(element)
+        return members
+
+    def finish(self):
+        """Complete the elements that could not take their pairs directly."""
+        for element, pairs in self.collected.values():
+            element.set_flat(pairs, self.sep)
+        for members in self.lists.values():
+            members.finish()
+
+
+class _FlatMembers(object):
+    """The members of a List gathered by a :class:`_FlatIngest`.
+
+    Members are created as their indexes are first seen.  Indexes that the
+    List's :attr:`~List.maximum_set_flat_members` would drop are ignored as
+    they arrive, so a long stream can not build more members than the List
+    will keep.
+
+    """
+
+    __slots__ = 'element', 'by_index', 'largest', 'top'
+
+    def __init__(self, element):
+        self.element = element
+        self.by_index = {}
+        # with prune_empty, a max-heap of the kept indexes
+        self.largest = []
+        # without, the highest index seen, kept or not
+        self.top = -1
+
+    def get(self, index):
+        """Return the member at flat *index*, or None if it is dropped."""
+        member = self.by_index.get(index)
+        if member is not None:
+            return member
+        element = self.element
+        maximum = element.maximum_set_flat_members
+        if not element.prune_empty:
+            # lossless: only indexes below the maximum are kept
+            if index > self.top:
+                self.top = index
+            if index >= maximum:
+                return None
+        elif len(self.by_index) >= maximum:
+            # lossy: the lowest indexes are kept, up to the maximum
+            if maximum < 1 or index > -self.largest[0]:
+                return None
+            del self.by_index[-heapq.heappushpop(self.largest, -index)]
+        else:
+            heapq.heappush(self.largest, -index)
+        member = self.by_index[index] = element.member_schema()
+        return member
+
+    def finish(self):
+        element, by_index = self.element, self.by_index
+        # lossy: missing (or empty-valued) indexes are omitted.
+        #        the python indexes may not match the flat indexes
+        if element.prune_empty:
+            for index in sorted(by_index):
+                list.append(element, element._new_slot(by_index[index]))
+            return
+        # lossless: elements are built up to the highest seen index or a
+        #           schema-configured maximum. flat + python indexes match.
+        top = min(self.top + 1, element.maximum_set_flat_members)
+        for index in range(top):
+            list.append(element, element._new_slot(
+                by_index.get(index, Unspecified)))
 
 
 class Dict(Mapping, dict):
@@ -972,6 +1349,7 @@ class Dict(Mapping, dict):
 
     def set(self, value, policy=None):
         """TODO: doc set()"""
+        self._mark_dirty()
         self.raw = value
         pairs = to_pairs(value)
         self._reset()
@@ -991,7 +1369,7 @@ class Dict(Mapping, dict):
                         'Dict %r schema does not allow key %r' % (
                             self.name, key))
                 continue
-            if dict.__contains__(self, key):
+            if dict.__contains__(self, key) or self.lazy_children:
                 converted &= self[key].set(value)
             else:
                 self[key] = el = fields[key]()
@@ -1150,12 +1528,16 @@ class SparseDict(Dict):
                                 (key, type(self).__name__, self.name))
             elif isinstance(value, schema):
                 value.parent = self
+                value._invalidate_names()
                 dict.__setitem__(self, key, value)
-                return
-            dict.__setitem__(self, key, schema(value, parent=self))
+            else:
+                dict.__setitem__(self, key, schema(value, parent=self))
+            self._mark_dirty()
         elif isinstance(value, schema):
             value.parent = self
+            value._invalidate_names()
             dict.__setitem__(self, key, value)
+            self._mark_dirty()
         else:
             self[key].set(value)
 
@@ -1163,6 +1545,7 @@ class SparseDict(Dict):
         if self.minimum_fields is None:
             try:
                 dict.__delitem__(self, key)
+                self._mark_dirty()
                 return
             except KeyError:
                 if not self.may_contain(key):
@@ -1183,9 +1566,11 @@ class SparseDict(Dict):
             raise TypeError('May not delete required key %r on %s %r' %
                             (key, type(self).__name__, self.name))
         dict.__delitem__(self, key)
+        self._mark_dirty()
 
     def clear(self):
         self._reset()
+        self._mark_dirty()
 
     def popitem(self):
         raise NotImplementedError
@@ -1196,7 +1581,9 @@ class SparseDict(Dict):
         if self.minimum_fields == 'required' and not self[key].optional:
             raise TypeError('May not pop required key %r on %s %r' %
                             (key, type(self).__name__, self.name))
-        return dict.pop(self, key)
+        value = dict.pop(self, key)
+        self._mark_dirty()
+        return value
 
     def setdefault(self, key, default=None):
         if not self.may_contain(key):
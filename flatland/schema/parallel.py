@@ -0,0 +1,131 @@
+"""Parallel validation of flat records across a process pool."""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from flatland.schema.base import _child_flattened_name
+
+
+__all__ = ['error_summary', 'summarize_records', 'validate_flat']
+
+_worker_schema = None
+_worker_state = None
+
+
+def validate_flat(schema, records, state=None, sep='_', max_workers=None,
+                  chunksize=256, mp_context=None):
+    """Validate flat records in parallel, yielding a summary of each.
+
+    :param schema: an :class:`~flatland.Element` class.  It is sent to each
+      worker process once, when the worker starts; with a ``spawn`` or
+      ``forkserver`` *mp_context* it must be picklable, for example a
+      :class:`~flatland.Form` subclass defined at module level.
+
+    :param records: an iterable of flat records, each a dict or a sequence
+      of key/value pairs as accepted by
+      :meth:`~flatland.Element.set_flat`.  Records are consumed lazily, so
+      this may be a one-shot iterator over a large input.
+
+    :param state: optional, passed to all validator callables.  Must be
+      picklable when it needs to cross into the workers.
+
+    :param sep: the separator used by the records' flattened names.
+
+    :param max_workers: the size of the process pool.  Defaults to the
+      number of CPUs.
+
+    :param chunksize: the number of records sent to a worker at a time.
+
+    :param mp_context: optional, a :mod:`multiprocessing` context for the
+      pool.
+
+    :returns: an iterator of ``(valid, errors)`` pairs, one per record and
+      in record order.  *valid* is the result of
+      :meth:`~flatland.Element.validate`.  *errors* maps the flattened name
+      of each element with error messages to a list of those messages; the
+      root element's name is ``''`` if it is unnamed.
+
+    Each worker builds an element with ``set_flat`` for every record in its
+    chunk and validates the chunk with
+    :meth:`~flatland.Element.validate_many`.  Only the summaries are sent
+    back, never the element trees.  At most two chunks per worker are in
+    flight at once.
+
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1, got %r" % chunksize)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    backlog = 2 * max_workers
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             mp_context=mp_context,
+                             initializer=_init_worker,
+                             initargs=(schema, state)) as executor:
+        pending = deque()
+        for chunk in _chunked(records, chunksize):
+            pending.append(executor.submit(_validate_chunk, chunk, sep))
+            if len(pending) >= backlog:
+                for summary in pending.popleft().result():
+                    yield summary
+        while pending:
+            for summary in pending.popleft().result():
+                yield summary
+
+
+def _chunked(records, chunksize):
+    chunk = []
+    for record in records:
+        if hasattr(record, 'items'):
+            record = list(record.items())
+        chunk.append(record)
+        if len(chunk) == chunksize:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _init_worker(schema, state):
+    global _worker_schema, _worker_state
+    schema.compile()
+    _worker_schema, _worker_state = schema, state
+
+
+def _validate_chunk(records, sep):
+    """Build, validate and summarize one chunk of records. In a worker."""
+    return summarize_records(_worker_schema, records, _worker_state, sep)
+
+
+def summarize_records(schema, records, state=None, sep='_'):
+    """Validate flat *records* in this process, as for :func:`validate_flat`.
+
+    Returns a list of ``(valid, errors)`` summaries.
+
+    """
+    elements = []
+    for record in records:
+        element = schema()
+        element.set_flat(record, sep)
+        elements.append(element)
+    results = schema.validate_many(elements, state)
+    return [(valid, error_summary(element, sep))
+            for valid, element in zip(results, elements)]
+
+
+def error_summary(element, sep='_'):
+    """Return a flattened name -> messages mapping of *element*'s errors.
+
+    Covers *element* and all of its children.  Names are built relative to
+    *element*, as :meth:`~flatland.Element.flattened_name` would for a root
+    element.
+
+    """
+    errors = {}
+    queue = deque([(element, element.name)])
+    while queue:
+        el, name = queue.popleft()
+        if el.has_errors():
+            errors[name or ''] = list(el.errors)
+        for child in el.children:
+            queue.append((child, _child_flattened_name(el, name, child, sep)))
+    return errors
@@ -1,17 +1,19 @@
 import re
+from collections import OrderedDict
+from itertools import islice
+from threading import Lock
+
 from flatland.util import symbol
 
 
 __all__ = ['pathexpr']
 
-expression_cache = {}
-max_cache_size = 1024
-
 TOP = symbol('TOP')
 UP = symbol('UP')
 HERE = symbol('HERE')
 SLICE = symbol('SLICE')
 NAME = symbol('NAME')
+GLOB = symbol('GLOB')
 
 _tokenize_re = re.compile(r"""
     (
@@ -31,20 +33,88 @@ _tokenize_re = re.compile(r"""
       \[
     )
     """, re.VERBOSE)
-_unescape_re = re.compile(r"\\(/|\[|\]|\.)")
+_unescape_re = re.compile(r"\\(/|\[|\]|\.|\*|\?)")
+_glob_re = re.compile(r"(\\.)|(\*)|(\?)|([^\\*?]+)")
+_wildcard_re = re.compile(r"(?<!\\)[*?]")
+
+
+class ExpressionCache(object):
+    """A bounded, least-recently-used cache of compiled path expressions.
+
+    :param maxsize: the number of expressions to retain.  ``0`` disables
+      caching; ``None`` removes the bound.  Use :meth:`resize` to change the
+      bound of an existing cache, such as the shared ``expression_cache``.
+
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.hits = self.misses = self.evictions = 0
+        self._expressions = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._expressions)
+
+    def __contains__(self, expr):
+        return expr in self._expressions
+
+    def get(self, expr):
+        """Return the :class:`PathExpression` for *expr*, compiling on miss."""
+        with self._lock:
+            try:
+                compiled = self._expressions[expr]
+            except KeyError:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._expressions.move_to_end(expr)
+                return compiled
+        compiled = PathExpression(expr)
+        with self._lock:
+            if self.maxsize != 0:
+                compiled = self._expressions.setdefault(expr, compiled)
+                self._expressions.move_to_end(expr)
+                self._trim()
+        return compiled
+
+    def resize(self, maxsize):
+        """Change the bound, evicting the least recently used as needed."""
+        with self._lock:
+            self.maxsize = maxsize
+            self._trim()
+
+    def clear(self):
+        """Empty the cache and reset its counters."""
+        with self._lock:
+            self._expressions.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """Return a mapping of the cache's counters and current size."""
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._expressions),
+                'maxsize': self.maxsize}
+
+    def _trim(self):
+        if self.maxsize is None:
+            return
+        while len(self._expressions) > self.maxsize:
+            self._expressions.popitem(last=False)
+            self.evictions += 1
+
+
+expression_cache = ExpressionCache()
 
 
 def pathexpr(expr):
+    if isinstance(expr, PathExpression):
+        return expr
     if not isinstance(expr, str):
         expr = str(expr)
-    try:
-        return expression_cache[expr]
-    except KeyError:
-        compiled = PathExpression(expr)
-        if len(expression_cache) < max_cache_size:
-            return expression_cache.setdefault(expr, compiled)
-        else:
-            return compile
+    return expression_cache.get(expr)
 
 
 class PathExpression(object):
@@ -54,12 +124,31 @@ class PathExpression(object):
         self.ops = tokenize(expr)
 
     def __call__(self, element, strict=False):
-        found = []
-        contexts = [(self.ops, element)]
+        return list(self.iterfind(element, strict))
+
+    def iterfind(self, element, strict=False):
+        """Generate the elements matching this expression, in order.
 
-        for _ops, el in contexts:
-            for idx in range(len(_ops)):
-                op, data = _ops[idx]
+        Elements are found as the iterator advances.  Containers selected
+        by a slice or a glob are walked member by member, without copying
+        their children, so callers can stop early.
+
+        """
+        ops = self.ops
+        end = len(ops)
+        # a depth-first walk: each level is the op to resume at and the
+        # iterator of elements still to resume it with
+        stack = [(0, iter((element,)))]
+        while stack:
+            start, pending = stack[-1]
+            for el in pending:
+                break
+            else:
+                stack.pop()
+                continue
+
+            for idx in range(start, end):
+                op, data = ops[idx]
                 if op is TOP:
                     el = el.root
                 elif op is UP:
@@ -83,13 +172,13 @@ class PathExpression(object):
                                     type_, data, self.expr))
                         break
                 elif op is SLICE:
-                    children = list(el.children)[data]
-                    contexts.extend((_ops[idx + 1:], child)
-                                    for child in children)
+                    stack.append((idx + 1, _sliced(el, data)))
+                    break
+                elif op is GLOB:
+                    stack.append((idx + 1, _globbed(el, data)))
                     break
             else:
-                found.append(el)
-        return found
+                yield el
 
     def __unicode__(self):
         return self.expr
@@ -98,7 +187,54 @@ class PathExpression(object):
         return 'pathexpr(%r)' % self.__unicode__()
 
 
-# TODO: glob syntax  foo/*/baz  sneep/_*/squiznart
+def _sliced(element, spec):
+    """Iterate the children of *element* selected by slice *spec*."""
+    if isinstance(element, list):
+        # Sequences: index members directly, rather than copying the list
+        if spec == _everything:
+            return iter(element)
+        return (element[idx]
+                for idx in range(*spec.indices(len(element))))
+    children = element.children
+    if _nonnegative(spec):
+        return islice(children, spec.start, spec.stop, spec.step)
+    return iter(list(children)[spec])
+
+
+_everything = slice(None)
+
+
+def _nonnegative(spec):
+    for value in spec.start, spec.stop, spec.step:
+        if value is not None and value < 0:
+            return False
+    return True
+
+
+def _globbed(element, match):
+    """Iterate the children of *element* with a name matching *match*."""
+    if isinstance(element, list):
+        # Sequence members are named by their index
+        return (child for idx, child in enumerate(element)
+                if match(str(idx)))
+    return (child for child in element.children
+            if child.name is not None and match(child.name))
+
+
+def _compile_glob(token):
+    """Return a matcher for the ``*`` and ``?`` wildcards in *token*."""
+    pattern = []
+    for escaped, star, question, literal in _glob_re.findall(token):
+        if escaped:
+            pattern.append(re.escape(escaped[1]))
+        elif star:
+            pattern.append('.*')
+        elif question:
+            pattern.append('.')
+        else:
+            pattern.append(re.escape(literal))
+    return re.compile(''.join(pattern), re.DOTALL).fullmatch
+
 
 def tokenize(path):
     """Parse *path* and return a list of (OP, data) pairs."""
@@ -136,6 +272,10 @@ def tokenize(path):
             tokens.append((previous[0], last))
             continue
 
+        # foo/*/baz, sneep/_*/squiznart
+        elif _wildcard_re.search(token):
+            tokens.append((GLOB, _compile_glob(token)))
+
         # foo/bar/baz[bogus] -> 'foo', 'bar', 'baz[bogus]'
         else:
             name = _unescape_re.sub(r'\1', token)
@@ -1,4 +1,4 @@
-from weakref import WeakKeyDictionary
+from weakref import WeakKeyDictionary, ref
 
 from flatland.util import symbol
 
@@ -55,36 +55,55 @@ class DictLike(object):
 
 
 class _TypeLookup(DictLike):
-    __slots__ = 'base', 'map', 'descriptor_id'
+    __slots__ = '_base', 'map', 'descriptor', 'version', 'view'
 
     def __init__(self, cls, descriptor):
-        self.base = cls
+        # weakly held: the lookup is cached per class by the descriptor
+        self._base = ref(cls)
         self.map = descriptor.map
-        self.descriptor_id = id(descriptor)
+        self.descriptor = descriptor
+        self.version = None
+        self.view = None
+
+    @property
+    def base(self):
+        return self._base()
+
+    def _resolved(self):
+        """The flattened properties of the type.
+
+        Rebuilt from the frames of the class hierarchy only when a frame has
+        changed since the last build.
+
+        """
+        version = self.descriptor.version
+        if self.version != version:
+            view = {}
+            for frame in self._frames():
+                for key, value in frame.items():
+                    view.setdefault(key, value)
+            self.view = dict((key, value) for key, value in view.items()
+                             if value is not Deleted)
+            self.version = version
+        return self.view
 
     def __getitem__(self, key):
-        for frame in self._frames():
-            try:
-                value = frame[key]
-            except KeyError:
-                pass
-            else:
-                if value is Deleted:
-                    raise KeyError(key)
-                return value
-        raise KeyError(key)
+        return self._resolved()[key]
 
     def __setitem__(self, key, value):
         self._base_frame[key] = value
+        self.descriptor.changed()
 
     def __delitem__(self, key):
         self[key]  # must exist to delete
         self._base_frame[key] = Deleted
+        self.descriptor.changed()
 
     def clear(self):
         frame = self._base_frame
         for key in self.keys():
             frame[key] = Deleted
+        self.descriptor.changed()
 
     def pop(self, key, *default):
         try:
@@ -97,30 +116,27 @@ class _TypeLookup(DictLike):
         return current
 
     def setdefault(self, key, default):
-        return self._base_frame.setdefault(key, default)
+        value = self._base_frame.setdefault(key, default)
+        self.descriptor.changed()
+        return value
 
     def update(self, *iterable, **values):
         simplified = dict(*iterable, **values)
         self._base_frame.update(simplified)
+        self.descriptor.changed()
 
     def iteritems(self):
-        seen = set()
-        for frame in self._frames():
-            for key, value in frame.items():
-                if key not in seen:
-                    seen.add(key)
-                    if value is not Deleted:
-                        yield (key, value)
+        return iter(list(self._resolved().items()))
 
     def _frames(self):
         for cls in self.base.__mro__:
             member = cls.__dict__.get('properties')
             if cls not in self.map:
-                if member is None or id(member) != self.descriptor_id:
+                if member is None or member is not self.descriptor:
                     continue
                 self.map.setdefault(cls, member.initial_set)
             yield self.map[cls]
-            if member is not None and id(member) == self.descriptor_id:
+            if member is not None and member is self.descriptor:
                 break
 
     @property
@@ -131,7 +147,7 @@ class _TypeLookup(DictLike):
             pass
         if 'properties' in self.base.__dict__:
             member = self.base.__dict__['properties']
-            if id(member) == self.descriptor_id:
+            if member is self.descriptor:
                 return self.map.setdefault(self.base, member.initial_set)
         return self.map.setdefault(self.base, {})
 
@@ -140,20 +156,30 @@ class local_storage(dict):
     """A marker type for local storage overlays."""
 
 
+_no_local = local_storage()
+
+
 class _InstanceLookup(DictLike):
-    __slots__ = 'local', 'class_lookup'
+    __slots__ = 'instance', 'class_lookup'
 
     def __init__(self, instance, class_lookup):
-        try:
-            local = instance.__dict__.setdefault('properties', local_storage())
-        except AttributeError:
+        if not hasattr(instance, '__dict__'):
             # Descriptor not supported for slots types.
             raise AttributeError(
                 "%s object has no attribute 'properties'" % (
                     instance.__class__))
-        self.local = local
+        self.instance = instance
         self.class_lookup = class_lookup
 
+    @property
+    def local(self):
+        """The instance's overlay, or an empty mapping if none yet."""
+        return self.instance.__dict__.get('properties', _no_local)
+
+    def _storage(self):
+        """The instance's overlay, created on first write."""
+        return self.instance.__dict__.setdefault('properties', local_storage())
+
     def __getitem__(self, key):
         try:
             value = self.local[key]
@@ -166,16 +192,17 @@ class _InstanceLookup(DictLike):
         return self.class_lookup[key]
 
     def __setitem__(self, key, value):
-        self.local[key] = value
+        self._storage()[key] = value
 
     def __delitem__(self, key):
         self[key]  # must exist to delete
-        self.local[key] = Deleted
+        self._storage()[key] = Deleted
 
     def clear(self):
-        self.local.clear()
+        local = self._storage()
+        local.clear()
         for key in list(self.class_lookup.keys()):
-            self.local[key] = Deleted
+            local[key] = Deleted
 
     def pop(self, key, *default):
         try:
@@ -187,11 +214,11 @@ class _InstanceLookup(DictLike):
         try:
             return self[key]
         except KeyError:
-            return self.local.setdefault(key, default)
+            return self._storage().setdefault(key, default)
 
     def update(self, *iterable, **values):
         simplified = dict(*iterable, **values)
-        self.local.update(simplified)
+        self._storage().update(simplified)
 
     def iteritems(self):
         seen = set()
@@ -212,9 +239,22 @@ class Properties(object):
         simplified = dict(*iterable, **initial_set)
         self.initial_set = simplified
         self.map = WeakKeyDictionary()
+        self.version = 0
+        self.lookups = WeakKeyDictionary()
+
+    def changed(self):
+        """Invalidate the flattened views after a frame is modified."""
+        self.version += 1
+
+    def lookup(self, cls):
+        """Return the shared property lookup for *cls*."""
+        try:
+            return self.lookups[cls]
+        except KeyError:
+            return self.lookups.setdefault(cls, _TypeLookup(cls, self))
 
     def __get__(self, instance, cls):
-        class_lookup = _TypeLookup(cls, self)
+        class_lookup = self.lookup(cls)
         if instance is None:
             return class_lookup
         try:
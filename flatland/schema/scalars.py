@@ -12,7 +12,7 @@ from flatland.util import (
     class_cloner,
     lazy_property,
     )
-from flatland.schema.base import Element
+from flatland.schema.base import Element, _tracked
 
 
 __all__ = (
@@ -49,6 +49,12 @@ class Scalar(Element):
 
     validates_down = 'validators'
 
+    # assigning either one marks the element for incremental validation
+    _value = None
+    value = _tracked('value', "The element's native Python value.")
+    _u = ''
+    u = _tracked('u', "A Unicode representation of the element's value.")
+
     def set(self, value):
         """Assign the native and Unicode value.
 
@@ -67,31 +73,47 @@ class Scalar(Element):
         contain ``unicode(value)`` or ``u''`` for none.
 
         """
+        self._mark_dirty()
         self.raw = value
         try:
             # adapt and normalize the value, if possible
-            value = self.value = self.adapt(value)
+            native = self.adapt(value)
         except AdaptationError:
-            self.value = None
             if value is None:
-                self.u = ''
+                u = ''
             elif isinstance(value, str):
-                self.u = value
+                u = value
             else:
                 try:
-                    self.u = str(value)
+                    u = str(value)
                 except UnicodeDecodeError:
-                    self.u = str(value, errors='replace')
+                    u = str(value, errors='replace')
+            self._store(None, u)
             return False
 
         # stringify it, possibly storing what we received verbatim or a
         # normalized version of it.
-        if value is None:
-            self.u = ''
+        if native is None:
+            self._store(None, '')
         else:
-            self.u = self.serialize(value)
+            self._store(native, self.serialize(native))
         return True
 
+    def _store(self, value, u):
+        """Assign :attr:`value` and :attr:`u` for :meth:`set`.
+
+        :meth:`set` has already marked the element changed, so unless a
+        subclass redefines the attributes their storage is written directly.
+
+        """
+        cls = type(self)
+        if cls.value is _tracked_value and cls.u is _tracked_u:
+            self._value = value
+            self._u = u
+        else:
+            self.value = value
+            self.u = u
+
     def adapt(self, value):
         """Given any value, try to coerce it into native format.
 
@@ -116,6 +138,39 @@ class Scalar(Element):
         """
         return str(value)
 
+    def adapt_many(self, values):
+        """Adapt a sequence of values at once.
+
+        :returns: a 2-tuple of a list of native values, one per item of
+          *values*, and a list of the indexes of *values* that could not be
+          adapted.  Native values at those indexes are ``None``.
+
+        The result is that of calling :meth:`adapt` on each value in turn.
+        Subclasses may provide faster implementations for their own
+        :meth:`adapt`, and fall back to this one when it is overridden.
+
+        """
+        adapt = self.adapt
+        natives, failed = [], []
+        for index, value in enumerate(values):
+            try:
+                natives.append(adapt(value))
+            except AdaptationError:
+                natives.append(None)
+                failed.append(index)
+        return natives, failed
+
+    def serialize_many(self, values):
+        """Serialize a sequence of native values at once.
+
+        :returns: a list of Unicode strings, as :meth:`set` would store in
+          :attr:`u` for each value: ``u''`` for ``None``, otherwise the
+          result of :meth:`serialize`.
+
+        """
+        serialize = self.serialize
+        return ['' if value is None else serialize(value) for value in values]
+
     def _index(self, name):
         raise IndexError(name)
 
@@ -157,6 +212,10 @@ class Scalar(Element):
             return None
 
 
+# the properties of Scalar.value and Scalar.u, see Scalar._store
+_tracked_value, _tracked_u = Scalar.__dict__['value'], Scalar.__dict__['u']
+
+
 class String(Scalar):
     """A regular old Unicode string."""
 
@@ -201,6 +260,10 @@ class String(Scalar):
         return True if (not self.value and self.u == '') else False
 
 
+# NumPy dtype kinds of booleans and numbers
+_numeric = frozenset('biuf')
+
+
 class Number(Scalar):
     """Base for numeric fields.
 
@@ -255,6 +318,52 @@ class Number(Scalar):
             return self.format % value
         return str(value)
 
+    def adapt_many(self, values):
+        """Adapt a sequence of values at once.
+
+        See :meth:`Scalar.adapt_many`.  NumPy arrays of a numeric dtype are
+        converted to Python numbers in a single ``tolist()`` call.
+
+        """
+        if type(self).adapt is not Number.adapt:
+            return Scalar.adapt_many(self, values)
+        if getattr(getattr(values, 'dtype', None), 'kind', None) in _numeric:
+            values = values.tolist()
+        type_, signed = self.type_, self.signed
+        natives, failed = [], []
+        append = natives.append
+        for index, value in enumerate(values):
+            if value is None:
+                append(None)
+                continue
+            if isinstance(value, str):
+                value = value.strip()
+            try:
+                native = type_(value)
+            except (ValueError, TypeError, ArithmeticError):
+                native = None
+            else:
+                if not signed and native < 0:
+                    native = None
+            if native is None:
+                failed.append(index)
+            append(native)
+        return natives, failed
+
+    def serialize_many(self, values):
+        """Serialize a sequence of values at once.
+
+        See :meth:`Scalar.serialize_many`.
+
+        """
+        if type(self).serialize is not Number.serialize:
+            return Scalar.serialize_many(self, values)
+        type_, format = self.type_, self.format
+        return [('' if value is None else
+                 format % value if type(value) is type_ else
+                 str(value))
+                for value in values]
+
 
 class Integer(Number):
     """Element type for Python's int."""
@@ -344,6 +453,42 @@ class Boolean(Scalar):
         """
         return self.true if value else self.false
 
+    def adapt_many(self, values):
+        """Adapt a sequence of values at once.
+
+        See :meth:`Scalar.adapt_many`.
+
+        """
+        if type(self).adapt is not Boolean.adapt:
+            return Scalar.adapt_many(self, values)
+        true = frozenset(self.true_synonyms) | frozenset((self.true,))
+        false = frozenset(self.false_synonyms) | frozenset((self.false,))
+        natives, failed = [], []
+        append = natives.append
+        for index, value in enumerate(values):
+            if not isinstance(value, str):
+                append(bool(value))
+            elif value in true:
+                append(True)
+            elif value in false:
+                append(False)
+            else:
+                append(None)
+                failed.append(index)
+        return natives, failed
+
+    def serialize_many(self, values):
+        """Serialize a sequence of values at once.
+
+        See :meth:`Scalar.serialize_many`.
+
+        """
+        if type(self).serialize is not Boolean.serialize:
+            return Scalar.serialize_many(self, values)
+        true, false = self.true, self.false
+        return ['' if value is None else true if value else false
+                for value in values]
+
 
 class Constrained(Scalar):
     """A scalar type with a constrained set of legal values.
@@ -497,6 +642,79 @@ class Temporal(Scalar):
         else:
             return str(value)
 
+    def adapt_many(self, values):
+        """Adapt a sequence of values at once.
+
+        See :meth:`Scalar.adapt_many`.  Strings in the canonical ISO 8601
+        layout of :class:`Date`, :class:`DateTime` and :class:`Time` are
+        parsed with the type's ``fromisoformat``; everything else, including
+        any string the fast parse rejects, goes through :meth:`adapt`.
+
+        """
+        iso = self._iso()
+        if iso is None:
+            return Scalar.adapt_many(self, values)
+        parse, isoformat = iso[1], iso[2]
+        adapt, strip = self.adapt, self.strip
+        natives, failed = [], []
+        append = natives.append
+        for index, value in enumerate(values):
+            if type(value) is str:
+                text = value.strip() if strip else value
+                try:
+                    native = parse(text)
+                except ValueError:
+                    pass
+                else:
+                    # fromisoformat accepts more than :attr:`regex`; only
+                    # take naive, exact round trips of the canonical layout
+                    if (getattr(native, 'tzinfo', None) is None and
+                        isoformat(native) == text):
+                        append(native)
+                        continue
+            try:
+                append(adapt(value))
+            except AdaptationError:
+                append(None)
+                failed.append(index)
+        return natives, failed
+
+    def serialize_many(self, values):
+        """Serialize a sequence of values at once.
+
+        See :meth:`Scalar.serialize_many`.  Values are formatted with the
+        type's ``isoformat`` when :attr:`format` is the canonical one.
+
+        """
+        iso = self._iso()
+        if iso is None or self.format != iso[3]:
+            return Scalar.serialize_many(self, values)
+        type_, isoformat, format, used = (
+            self.type_, iso[2], self.format, self.used)
+        serialized = []
+        append = serialized.append
+        for value in values:
+            if value is None:
+                append('')
+            elif (type(value) is type_ and
+                  getattr(value, 'tzinfo', None) is None):
+                append(isoformat(value))
+            elif isinstance(value, type_):
+                append(format % dict(
+                    (field, getattr(value, field)) for field in used))
+            else:
+                append(str(value))
+        return serialized
+
+    def _iso(self):
+        """The :data:`_iso_layouts` entry for this field, or None."""
+        if type(self).adapt is not Temporal.adapt:
+            return None
+        iso = _iso_layouts.get(self.regex)
+        if iso is None or iso[0] is not self.type_:
+            return None
+        return iso
+
 
 class DateTime(Temporal):
     """Element type for Python datetime.datetime.
@@ -542,6 +760,24 @@ class Time(Temporal):
     used = ('hour', 'minute', 'second')
 
 
+# canonical regex -> (type_, parse, isoformat, format) for the batch methods
+# of Temporal.  Each isoformat produces exactly the canonical format.
+_iso_layouts = {
+    DateTime.regex: (datetime.datetime,
+                     datetime.datetime.fromisoformat,
+                     lambda value: value.isoformat(' ', 'seconds'),
+                     DateTime.format),
+    Date.regex: (datetime.date,
+                 datetime.date.fromisoformat,
+                 datetime.date.isoformat,
+                 Date.format),
+    Time.regex: (datetime.time,
+                 datetime.time.fromisoformat,
+                 lambda value: value.isoformat('seconds'),
+                 Time.format),
+    }
+
+
 class Ref(Scalar):
     flattenable = False
 
@@ -117,7 +117,7 @@ def markup_test(markup='xml', schema=None):
 
     """
     def decorator(fn):
-        expected = fn.__doc__.decode('utf8').strip()
+        expected = fn.__doc__.strip()
 
         @wraps(fn)
         def test():
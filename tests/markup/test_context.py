@@ -1,4 +1,4 @@
-from flatland.out.generic import Context, _default_context
+from flatland.out.generic import Context, _default_context, transform
 from tests._util import assert_raises
 
 Nothing = object()
@@ -110,3 +110,53 @@ def test_stack_plain_push_pop():
     assert ctx[needle] == initial_value
 
     assert_raises(RuntimeError, ctx.pop)
+
+
+def test_stack_nested_reads():
+    ctx = Context()
+    first, second = list(_default_context.keys())[:2]
+    sentinels = [object(), object()]
+
+    ctx.push()
+    ctx[first] = sentinels[0]
+    ctx.push()
+    assert ctx[first] is sentinels[0]
+    ctx.push()
+    assert ctx[first] is sentinels[0]
+    ctx[first] = sentinels[1]
+    assert ctx[second] == _default_context[second]
+    ctx.pop()
+    assert ctx[first] is sentinels[0]
+    ctx[second] = sentinels[1]
+    ctx.push()
+    assert ctx[first] is sentinels[0]
+    assert ctx[second] is sentinels[1]
+    assert 'xyzzy' not in ctx
+    assert_raises(KeyError, lambda: ctx['xyzzy'])
+    ctx.pop()
+    ctx.pop()
+    assert ctx[first] is sentinels[0]
+    assert ctx[second] == _default_context[second]
+    ctx.pop()
+    assert ctx[first] == _default_context[first]
+    assert repr(ctx) == 'Context(%r)' % (_default_context,)
+
+
+def test_stack_frames_hold_own_settings():
+    ctx = Context()
+    first, second = list(_default_context.keys())[:2]
+
+    ctx.push()
+    ctx[first] = Nothing
+    ctx.push()
+    transform('input', {}, '', ctx, None)
+    assert ctx[second] == _default_context[second]
+    assert ctx._frames[-1] == {}
+    ctx[second] = Nothing
+    ctx.push()
+    assert ctx[first] is Nothing
+    assert ctx[second] is Nothing
+    assert ctx._frames[1:] == [{first: Nothing}, {second: Nothing}, {}]
+    ctx.pop()
+    ctx.pop()
+    assert ctx[second] == _default_context[second]
@@ -0,0 +1,52 @@
+from flatland.out import escape
+from flatland.out.escape import escape_attribute, escape_text
+from flatland.out.generic import Markup
+
+from tests._util import assert_raises
+
+
+samples = [
+    ('', '', ''),
+    ('plain', 'plain', 'plain'),
+    ('a & b', 'a &amp; b', 'a &amp; b'),
+    ('<b>"x"</b>', '&lt;b&gt;"x"&lt;/b&gt;',
+     '&lt;b&gt;&quot;x&quot;&lt;/b&gt;'),
+    ("it's", "it's", "it's"),
+    ('&amp;', '&amp;amp;', '&amp;amp;'),
+    # long enough for markupsafe, where installed
+    ('<\'"&#34;>' * 64,
+     '&lt;\'"&amp;#34;&gt;' * 64,
+     '&lt;\'&quot;&amp;#34;&gt;' * 64),
+    ('<&>' * 128, '&lt;&amp;&gt;' * 128, '&lt;&amp;&gt;' * 128),
+    ]
+
+
+def test_escape():
+    for string, text, attribute in samples:
+        assert escape_text(string) == text
+        assert escape_attribute(string) == attribute
+
+
+def test_markup_passthrough():
+    markup = Markup('<b>"x"</b>')
+    assert escape_text(markup) == '<b>"x"</b>'
+    assert escape_attribute(markup) == '<b>"x"</b>'
+    assert type(escape_attribute(markup)) is str
+    assert escape_text(None) == ''
+
+
+def test_backends():
+    assert 'python' in escape.backends
+    original = escape._text, escape._attribute
+    try:
+        for name in escape.backends:
+            escape.use_backend(name)
+            for string, text, attribute in samples:
+                assert escape_text(string) == text, name
+                assert escape_attribute(string) == attribute, name
+    finally:
+        escape._text, escape._attribute = original
+
+
+def test_unknown_backend():
+    assert_raises(ValueError, escape.use_backend, 'bogus')
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from flatland import String
+from flatland import Boolean, DateYYYYMMDD, Enum, Form, List, String
 from flatland.out.markup import Generator
 
 from tests.markup._util import markup_test
@@ -84,6 +84,61 @@ def test_textarea_explicit_contents(gen, el):
     return gen.textarea.contents
 
 
+class Profile(Form):
+    name = String.using(label='Name & title')
+    admin = Boolean
+    color = Enum.valued('red', 'blue')
+    tags = List.of(String)
+    born = DateYYYYMMDD
+
+
+def test_stream():
+    gen = Generator('xml')
+    form = Profile({'name': '<x>', 'admin': True, 'color': 'blue',
+                    'tags': ['a']})
+
+    rendered = ''.join(gen.stream(form))
+    assert rendered == (
+        '<fieldset>'
+        '<label>Name &amp; title</label>'
+        '<input type="text" name="name" value="&lt;x&gt;" />'
+        '<input type="checkbox" name="admin" value="1" checked="checked" />'
+        '<select name="color">'
+        '<option value="red">red</option>'
+        '<option value="blue" selected="selected">blue</option>'
+        '</select>'
+        '<fieldset><input type="text" name="tags_0" value="a" /></fieldset>'
+        '<fieldset>'
+        '<input type="text" name="born_year" value="" />'
+        '<input type="text" name="born_month" value="" />'
+        '<input type="text" name="born_day" value="" />'
+        '</fieldset>'
+        '</fieldset>')
+
+
+def test_stream_chunks():
+    gen = Generator('xml')
+    form = Profile({'tags': ['x' * 10] * 50})
+    whole = ''.join(gen.stream(form))
+
+    chunks = list(gen.stream(form, chunk_size=100))
+    assert ''.join(chunks) == whole
+    assert len(chunks) > 1
+    assert all(len(chunk) >= 100 for chunk in chunks[:-1])
+
+
+def test_stream_settings():
+    gen = Generator('xml')
+    form = Profile()
+
+    chunks = gen.stream(form, chunk_size=1, auto_domid=True)
+    first = next(chunks)
+    assert first == '<fieldset>'
+    assert gen['auto_domid'] is True
+    assert 'id="f_name"' in ''.join(chunks)
+    assert gen['auto_domid'] is False
+
+
 def test_Markup_concatenation():
     from flatland.out.generic import Markup as Markup
     implementations = [Markup]
@@ -139,6 +139,118 @@ def test_stream_preserved():
     assert rendered == expected
 
 
+def test_select_loop():
+    markup = """\
+<select form:bind="form">
+  <option py:for="value in ('a', 'b', 'c')" value="${value}">${value}</option>
+  <optgroup label="more">
+    <option py:for="value in ('val', 'd')">${value}</option>
+  </optgroup>
+</select>
+    """
+
+    expected = """\
+<select name="element">
+  <option value="a">a</option><option value="b">b</option><option value="c">c</option>
+  <optgroup label="more">
+    <option selected="selected">val</option><option>d</option>
+  </optgroup>
+</select>"""
+
+    rendered = render(markup, 'xhtml', schema.from_defaults)
+    assert rendered == expected
+
+
+def test_template_reuse():
+    from genshi.template import MarkupTemplate
+    from flatland.out.genshi import setup as setup_template
+    from tests.markup._util import _wrap_with_xmlns
+
+    markup = """\
+<input form:bind="form" form:auto-domid="${DOMID}" class="c${N}" />
+<select form:bind="form">
+  <option py:for="value in OPTIONS">${value}</option>
+</select>
+"""
+    expected = """\
+<input class="c%s" name="element" value="%s"%s />
+<select name="element">
+  %s
+</select>"""
+
+    template = MarkupTemplate(_wrap_with_xmlns(markup, 'xhtml'))
+    setup_template(template)
+
+    def render(value, **kw):
+        form = schema(value)
+        output = template.generate(form=form, **kw).render('xhtml')
+        return output[output.index('\n') + 1:output.rindex('\n')].strip()
+
+    first = render('a', DOMID='on', N=1, OPTIONS=('a', 'b'))
+    assert first == expected % (
+        1, 'a', ' id="f_element"',
+        '<option selected="selected">a</option><option>b</option>')
+
+    second = render('b', DOMID='off', N=2, OPTIONS=('a', 'b', 'c'))
+    assert second == expected % (
+        2, 'b', '',
+        '<option>a</option><option selected="selected">b</option>'
+        '<option>c</option>')
+
+    assert render('a', DOMID='on', N=1, OPTIONS=('a', 'b')) == first
+
+
+def test_analyses_bounded():
+    from genshi.core import Stream
+    from genshi.template import MarkupTemplate
+    from genshi.template.base import SUB
+    from flatland.out.genshi import EvaluatedLast, setup as setup_template
+    from tests.markup._util import _wrap_with_xmlns
+
+    markup = """\
+<input form:bind="form" py:attrs="{'class': 'c%s' % N}" />
+<select form:bind="form" py:attrs="{'class': 'c%s' % N}">
+  <option py:for="value in OPTIONS" value="${value}">x</option>
+</select>
+"""
+    template = MarkupTemplate(_wrap_with_xmlns(markup, 'xhtml'))
+    setup_template(template)
+
+    def directives(stream):
+        for kind, data, pos in stream:
+            if kind is SUB:
+                for d in data[0]:
+                    if isinstance(d, EvaluatedLast):
+                        yield d
+                for d in directives(data[1]):
+                    yield d
+
+    def sizes():
+        found = []
+        for d in directives(Stream(template.stream)):
+            analyses = d.analyses
+            found.append(len(analyses))
+            for data, key, tag in analyses.values():
+                if tag.options is not None:
+                    found.append(len(tag.options))
+        return found
+
+    def render(n):
+        form = schema('b')
+        return template.generate(form=form, N=n,
+                                 OPTIONS=('a', 'b', str(n))).render('xhtml')
+
+    output = render(0)
+    assert 'class="c0"' in output
+    assert '<option value="b" selected="selected">x</option>' in output
+    before = sizes()
+    assert before and all(before)
+
+    for n in range(1, 50):
+        assert render(n).count('class="c%s"' % n) == 2
+    assert sizes() == before
+
+
 def test_tortured_select():
     markup = """\
 <select form:bind="form">
@@ -0,0 +1,174 @@
+from flatland import Array, Form, String
+from flatland.out.generic import Markup
+from flatland.out.markup import FragmentCache, Generator
+from tests._util import assert_raises
+
+
+class Login(Form):
+    name = 'login'
+
+    username = String
+    password = String
+
+
+def test_repeat_hits():
+    cache = FragmentCache()
+    gen = Generator('xhtml', fragment_cache=cache)
+    form = Login({'username': 'jek'})
+
+    first = gen.input(form['username'], type='text')
+    assert first == '<input type="text" name="login_username" value="jek" />'
+    assert cache.stats()['misses'] == 1
+
+    again = Generator('xhtml', fragment_cache=cache)
+    assert again.input(form['username'], type='text') == first
+    assert cache.stats()['hits'] == 1
+
+    form['username'] = 'bob'
+    assert gen.input(form['username'], type='text') == (
+        '<input type="text" name="login_username" value="bob" />')
+    assert gen.input(Login()['username'], type='text') == (
+        '<input type="text" name="login_username" value="" />')
+    assert cache.stats()['hits'] == 1
+
+
+def test_settings_keyed():
+    cache = FragmentCache()
+    gen = Generator('xhtml', fragment_cache=cache)
+    el = Login({'username': 'jek'})['username']
+
+    plain = gen.input(el)
+    gen.begin(auto_domid=True)
+    assert gen.input(el) == (
+        '<input name="login_username" value="jek" id="f_login_username" />')
+    gen.end()
+    assert gen.input(el) == plain
+    assert Generator('html', fragment_cache=cache).input(el) == (
+        '<input name="login_username" value="jek">')
+    assert cache.stats()['hits'] == 1
+
+
+def test_markup_keyed():
+    gen = Generator('xhtml', fragment_cache=FragmentCache())
+
+    assert gen.input(value=Markup('a&amp;b')) == '<input value="a&amp;b" />'
+    assert gen.input(value='a&amp;b') == '<input value="a&amp;amp;b" />'
+    assert gen.input(value=Markup('a&amp;b')) == '<input value="a&amp;b" />'
+
+    assert gen.textarea(contents='<b>') == '<textarea><b></textarea>'
+    assert gen.textarea(contents=Markup('<b>')) == '<textarea><b></textarea>'
+
+    el = String.named('s')()
+    el.u = Markup('a&amp;b')
+    assert gen.input(el, type='text') == (
+        '<input type="text" name="s" value="a&amp;b" />')
+    el.u = 'a&amp;b'
+    assert gen.input(el, type='text') == (
+        '<input type="text" name="s" value="a&amp;amp;b" />')
+
+
+def test_contents():
+    gen = Generator('xhtml', fragment_cache=FragmentCache())
+    el = Login({'username': '<jek>'})['username']
+
+    for _ in range(2):
+        tag = gen.textarea
+        assert tag(el) == (
+            '<textarea name="login_username">&lt;jek&gt;</textarea>')
+        assert tag.contents == '&lt;jek&gt;'
+
+
+def test_uncacheable():
+    cache = FragmentCache()
+    gen = Generator('xhtml', fragment_cache=cache)
+    form = Login({'username': 'jek'})
+
+    gen.input(form['username'], auto_domid=True)
+    gen.input(form['username'], auto_domid=True)
+    gen.input(Array.of(String).named('many')(['a']), type='checkbox')
+
+    gen.begin(auto_tabindex=True, tabindex=1)
+    assert gen.input(form['username']) == (
+        '<input name="login_username" value="jek" tabindex="1" />')
+    assert gen.input(form['username']) == (
+        '<input name="login_username" value="jek" tabindex="2" />')
+    gen.end()
+    assert len(cache) == 0
+
+
+def test_filters():
+    cache = FragmentCache()
+    gen = Generator('xhtml', fragment_cache=cache)
+    el = Login({'username': 'jek'})['username']
+    calls = []
+
+    def counted(tagname, attributes, contents, context, bind):
+        calls.append(tagname)
+        return contents
+
+    gen.begin(auto_filter=True, filters=(counted,))
+    gen.input(el)
+    gen.input(el)
+    assert len(calls) == 2
+
+    counted.cacheable = True
+    gen.input(el)
+    gen.input(el)
+    assert len(calls) == 3
+    gen.end()
+
+
+def test_unhashable_settings():
+    cache = FragmentCache()
+    gen = Generator('xhtml', fragment_cache=cache)
+    el = Login({'username': 'jek'})['username']
+
+    def passthrough(tagname, attributes, contents, context, bind):
+        return contents
+    passthrough.cacheable = True
+
+    gen.begin(auto_filter=True, filters=[passthrough])
+    assert gen['filters'] == (passthrough,)
+    gen.input(el)
+    gen.input(el)
+    assert cache.stats()['hits'] == 1
+    gen.end()
+
+    assert_raises(TypeError, gen.begin, domid_format={})
+    assert_raises(TypeError, gen.set, filters={})
+
+
+def test_frames_stay_small():
+    gen = Generator('xhtml', fragment_cache=FragmentCache())
+    el = Login({'username': 'jek'})['username']
+
+    gen.input(el)
+    gen.input(el)
+    assert gen._frames[-1] == {}
+    gen.begin(auto_domid=True)
+    gen.input(el)
+    assert gen._frames[-1] == {'auto_domid': True}
+    gen.end()
+
+
+def test_eviction():
+    cache = FragmentCache(maxsize=2)
+    gen = Generator('xhtml', fragment_cache=cache)
+
+    for name in 'a', 'b', 'a', 'c':
+        gen.tag('p', contents=name)
+    assert len(cache) == 2
+    assert cache.stats()['evictions'] == 1
+    assert cache.chars == len('<p>a</p>') * 2
+
+    cache = FragmentCache(maxsize=None, maxchars=20)
+    gen = Generator('xhtml', fragment_cache=cache)
+    for name in 'a', 'b', 'c':
+        gen.tag('p', contents=name)
+    assert len(cache) == 2
+    assert cache.chars == 16
+
+    cache.clear()
+    assert cache.stats() == {'hits': 0, 'misses': 0, 'evictions': 0,
+                             'size': 0, 'maxsize': None,
+                             'chars': 0, 'maxchars': 20}
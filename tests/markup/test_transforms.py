@@ -730,3 +730,39 @@ def test_filter_want():
     expected = {}
     assert_bound_transform(generic.transform_filters,
                            'horse', given, expected, context=context)
+
+
+def test_transform_plan():
+    bind = schema(123)
+
+    def full(tagname, given, context):
+        attributes = given.copy()
+        for fn in generic._transforms:
+            fn(tagname, attributes, None, context, bind)
+        return attributes
+
+    context = Context()
+    for tagname in 'input', 'label', 'textarea', 'div':
+        for given in ({}, {'auto_domid': 'on'}, {'auto_name': 'off'},
+                      {'auto_for': True, 'name': 'x'}):
+            attributes = given.copy()
+            generic.transform(tagname, attributes, None, context, bind)
+            assert attributes == full(tagname, given, context)
+
+    def filter1(tagname, attributes, contents, context, bind):
+        attributes['donut'] = 'xyzzy'
+        return contents
+
+    context['auto_domid'] = 'on'
+    context['auto_filter'] = True
+    context['filters'] = [filter1]
+    attributes = {}
+    generic.transform('input', attributes, None, context, bind)
+    assert attributes == {'id': 'f_number', 'name': 'number',
+                          'value': '123', 'donut': 'xyzzy'}
+
+    context['auto_name'] = False
+    context['filters'] = []
+    attributes = {}
+    generic.transform('input', attributes, None, context, bind)
+    assert attributes == {'id': 'f_number', 'value': '123'}
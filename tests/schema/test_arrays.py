@@ -72,6 +72,14 @@ def test_set_flat_anonymous_dict():
     assert_raises(AssertionError, schema.from_flat, pairs)
 
 
+def test_set_flat_custom_separator():
+    schema = Array.named('a').of(String.named('s'))
+    el = schema()
+    el.set_flat([('a.s', 'abc'), ('a_s', 'xxx'), ('a.s', 'def'), ('a', 'yyy')],
+                sep='.')
+    eq_(el.value, ['abc', 'def'])
+
+
 def test_set():
     schema = Array.of(Integer)
     el = schema()
@@ -146,6 +146,45 @@ def test_message_buckets():
     eq_(el.warnings, ['warning'])
 
 
+def test_message_buckets_allocated_on_use():
+    el, other = Element(), Element()
+    assert 'errors' not in el.__dict__
+    assert 'warnings' not in el.__dict__
+
+    el.errors.append('error')
+    eq_(el.errors, ['error'])
+    eq_(other.errors, [])
+
+    # the first read allocates the list, later reads find it directly
+    errors = other.errors
+    assert other.errors is errors
+    assert type(errors) is list
+    errors += ['a']
+    other.add_error('b')
+    eq_(other.errors, ['a', 'b'])
+
+    el.warnings.extend(['w1', 'w2'])
+    el.warnings.remove('w1')
+    eq_(el.warnings, ['w2'])
+    eq_(other.warnings, [])
+    assert 'warnings' not in Element().__dict__
+
+
+def test_message_helpers():
+    el = Element()
+    assert not el.has_errors()
+    assert 'errors' not in el.__dict__
+
+    el.add_error('error')
+    el.add_warning('warning')
+    assert el.has_errors()
+    el.clear_messages()
+    assert not el.has_errors()
+    eq_(el.errors, [])
+    eq_(el.warnings, [])
+    el.clear_messages()
+
+
 def test_validation():
     ok = lambda item, data: True
     not_ok = lambda item, data: False
@@ -239,3 +278,30 @@ def test_default_value():
     # a default_factory may reference el.default
     el = Element(default='mno', default_factory=lambda x: x.default)
     assert el.default_value == 'mno'
+
+
+def test_compile():
+    schema = Element.named('x').using(default=1)
+
+    plan = schema.compile()
+    assert schema.compile() is plan
+    assert plan.schema is schema
+    eq_(plan.fields, ())
+    eq_(dict(plan.field_index), {})
+
+    # plans are per-class, and unaffected by settings they do not hold
+    assert schema.named('y').compile() is not plan
+    schema.default = 2
+    schema.properties['a'] = 1
+    assert schema.compile() is plan
+    assert plan.is_current()
+
+    # and rebuilt when the class's fields change
+    field = Element.named('f')
+    schema.field_schema = [field]
+    assert not plan.is_current()
+    plan = schema.compile()
+    eq_(plan.fields, (field,))
+    schema.field_schema.append(Element.named('g'))
+    assert not plan.is_current()
+    eq_(sorted(schema.compile().field_index), ['f', 'g'])
@@ -0,0 +1,138 @@
+import datetime
+
+from flatland import (
+    Boolean,
+    Date,
+    DateTime,
+    Decimal,
+    Dict,
+    Float,
+    Form,
+    Integer,
+    JoinedString,
+    String,
+    Time,
+    )
+from flatland.schema.columnar import adapt_columns
+from flatland.schema.parallel import summarize_records
+from flatland.validation import Present, ValueAtLeast
+from tests._util import assert_raises, eq_
+
+
+class Record(Form):
+    name = String.using(validators=[Present()])
+    age = Integer.using(validators=[Present(), ValueAtLeast(minimum=0)])
+    address = Dict.of(Boolean.named('verified'))
+
+
+def test_adapt_many_matches_set():
+    cases = [
+        (Integer, ['1', ' 2 ', None, 'x', 3.5, '']),
+        (Integer.using(signed=False), ['1', '-1']),
+        (Float, ['1.5', 'nan', 'x', 2]),
+        (Decimal, ['1.25', 'x']),
+        (Boolean, ['on', 'off', '', 'maybe', 0, 1]),
+        (String, ['a', None, 1]),
+        ]
+    for schema, values in cases:
+        element = schema()
+        natives, failed = element.adapt_many(values)
+        expected_failed = []
+        for index, value in enumerate(values):
+            if not schema().set(value):
+                expected_failed.append(index)
+        eq_(failed, expected_failed)
+        for native, value in zip(natives, values):
+            if not isinstance(native, float) or native == native:
+                eq_(native, schema(value).value)
+        eq_(element.serialize_many(natives),
+            [schema(native).u for native in natives])
+
+
+def test_adapt_many_temporal():
+    d, dt, t = datetime.date, datetime.datetime, datetime.time
+    cases = [
+        (Date, [' 2010-01-02 ', '2010-13-01', '20100102', '2010-W01-1',
+                '0999-01-01', 'x', None, dt(2010, 1, 2, 3, 4, 5)],
+         [d(2010, 1, 2), None, None, None, d(999, 1, 1), None, None,
+          dt(2010, 1, 2, 3, 4, 5)],
+         ['2010-01-02', '', '', '', '0999-01-01', '', '', '2010-01-02']),
+        (DateTime, ['2010-01-02 03:04:05', '2010-01-02T03:04:05',
+                    '2010-01-02 03:04:05+00:00', '2010-01-02 03:04:05.5'],
+         [dt(2010, 1, 2, 3, 4, 5), None, None, None],
+         ['2010-01-02 03:04:05', '', '', '']),
+        (Time, ['03:04:05', '03:04', '03:04:05Z', '24:00:00'],
+         [t(3, 4, 5), None, None, None],
+         ['03:04:05', '', '', '']),
+        (Date.using(strip=False), [' 2010-01-02'], [None], ['']),
+        ]
+    for schema, values, expected, serialized in cases:
+        element = schema()
+        natives, failed = element.adapt_many(values)
+        eq_(natives, expected)
+        eq_(failed, [index for index, value in enumerate(values)
+                     if value is not None and expected[index] is None])
+        eq_(element.serialize_many(natives), serialized)
+
+
+def test_adapt_columns():
+    columns = {'name': ['a', '', 'c', 'd'],
+               'age': ['1', '2', 'x', '-4'],
+               'address_verified': ['1', '', '', 'maybe']}
+    batch = adapt_columns(Record, columns)
+    eq_(len(batch), 4)
+    eq_(batch.columns['age'], [1, 2, None, -4])
+    eq_(batch.columns['address_verified'], [True, False, False, None])
+    eq_(batch.failed['age'], [2])
+    eq_(batch.valid, [True, True, False, False])
+    eq_(batch.invalid_rows, [2, 3])
+    eq_(batch.serialized('age'), ['1', '2', 'x', '-4'])
+
+    batch = adapt_columns(Record, columns, validate=True)
+    eq_(batch.valid, [True, False, False, False])
+    eq_(batch.errors(1), {'name': ['name may not be blank.']})
+    eq_([row for row, _ in batch.elements()], [1, 2, 3])
+
+    element = batch.element(0)
+    eq_(element.value, {'name': 'a', 'age': 1,
+                        'address': {'verified': True}})
+
+
+def test_adapt_columns_blanks():
+    class Optional(Form):
+        name = String.using(validators=[Present()])
+        age = Integer.using(optional=True)
+        score = Float.using(optional=True)
+
+    columns = {'name': ['a', 'b', '', 'd'],
+               'age': ['1', '', None, ' '],
+               'score': ['', '1.5', None, '  ']}
+    records = [dict((name, column[row]) for name, column in columns.items())
+               for row in range(4)]
+    expected = [valid for valid, _ in summarize_records(Optional, records)]
+    eq_(expected, [True, True, False, True])
+
+    batch = adapt_columns(Optional, columns, validate=True)
+    eq_(batch.valid, expected)
+    eq_(batch.failed['age'], [1, 3])
+    eq_(batch.columns['age'], [1, None, None, None])
+    eq_(batch.serialized('age'), ['1', '', '', ' '])
+    eq_(adapt_columns(Optional, columns).valid, [True] * 4)
+
+    records = [{'name': 'a', 'age': ''}, {'name': '', 'age': '2'}]
+    batch = adapt_columns(Record, {'name': ['a', ''], 'age': ['', '2']},
+                          validate=True)
+    eq_(batch.valid, [valid for valid, _ in
+                      summarize_records(Record, records)])
+    eq_(batch.valid, [False, False])
+    eq_(batch.errors(0), {'age': ['age may not be blank.']})
+
+
+def test_adapt_columns_errors():
+    assert_raises(KeyError, adapt_columns, Record, {'nope': []})
+    assert_raises(KeyError, adapt_columns, Record, {'address': []})
+    assert_raises(TypeError, adapt_columns,
+                  Record.of(JoinedString.named('tags')), {'tags': []})
+    assert_raises(ValueError, adapt_columns, Record,
+                  {'name': ['a'], 'age': []})
+    eq_(len(adapt_columns(Record, {})), 0)
@@ -354,3 +354,72 @@ def test_naming_list_list():
         assert leaf.el('.') is root
 
         assert root.el(['0', '0']) is leaf
+
+
+def test_naming_follows_renumbering():
+    schema = List.named('l').of(String.named('s'))
+    root = schema(['x', 'y'])
+    leaf = root[1]
+    assert leaf.fq_name() == '.1'
+    assert leaf.flattened_name() == 'l_1_s'
+
+    root.insert(0, 'w')
+    assert leaf.fq_name() == '.2'
+    assert leaf.flattened_name() == 'l_2_s'
+
+    del root[:2]
+    assert leaf.fq_name() == '.0'
+    assert leaf.flattened_name() == 'l_0_s'
+    assert root.flatten() == [('l_0_s', 'y')]
+
+
+def test_naming_follows_reparenting():
+    leaf = String.named('s')('x')
+    assert leaf.fq_name() == '.'
+    assert leaf.flattened_name() == 's'
+
+    root = Sequence.named('seq').of(String.named('s'))()
+    root.append(leaf)
+    assert leaf.fq_name() == '.s'
+    assert leaf.flattened_name() == 'seq_s'
+    assert root.flatten() == [('seq_s', 'x')]
+
+    inner = Dict.named('d').of(String.named('s'))()
+    assert inner['s'].fq_name() == '.s'
+    assert inner['s'].flattened_name() == 'd_s'
+    root.append(inner)
+    assert inner['s'].fq_name() == '.d.s'
+    assert inner['s'].flattened_name() == 'seq_d_s'
+
+
+def test_iterflatten():
+    schema = Dict.named('d').of(
+        String.named('a'),
+        List.named('l').of(Dict.named('r').of(Integer.named('x'),
+                                              Integer.named('y'))))
+    root = schema({'a': 'v', 'l': [{'x': 1, 'y': 2}, {'x': 3, 'y': 4}]})
+
+    pairs = list(root.iterflatten())
+    assert sorted(pairs) == sorted(root.flatten())
+    names = [name for name, _ in pairs]
+    assert names.index('d_l_0_r_y') < names.index('d_l_1_r_x')
+
+    assert list(root['l'][1].iterflatten(value=lambda el: el.value)) == [
+        ('d_l_1_r_x', 3), ('d_l_1_r_y', 4)]
+    assert list(root['a'].iterflatten('.')) == [('d.a', 'v')]
+
+
+def test_fq_name_follows_reparenting():
+    schema = Dict.named('d').of(String.named('s'))
+
+    inner = schema()
+    assert inner['s'].fq_name() == '.s'
+    root = List.named('l').of(schema)()
+    root.append(inner)
+    assert inner['s'].fq_name() == '.0.s'
+
+    inner = schema()
+    assert inner['s'].fq_name() == '.s'
+    root = Sequence.named('seq').of(schema)()
+    root.append(inner)
+    assert inner['s'].fq_name() == '.d.s'
@@ -1,6 +1,8 @@
 from flatland import (
     Dict,
+    Form,
     Integer,
+    List,
     String,
     SparseDict,
     Unset,
@@ -321,6 +323,214 @@ def test_dict_raw():
     assert el['x'].raw == '123'
 
 
+def test_dict_set_flat_nested():
+    schema = Dict.named('top').of(
+        Integer.named('x'),
+        Dict.named('sub').of(Integer.named('x'),
+                             Dict.named('deep').of(Integer.named('z'))))
+    el = schema.from_flat([('top_x', '1'),
+                           ('top_sub_x', '2'),
+                           ('top_sub_deep_z', '3'),
+                           ('top_sub', 'ignored'),
+                           ('top_sub_deep_nope', '4'),
+                           ('top_subx', '5'),
+                           ('other_x', '6')])
+    eq_(el.value, {'x': 1, 'sub': {'x': 2, 'deep': {'z': 3}}})
+    assert el['sub'].raw is Unset
+
+
+def test_dict_set_flat_separator_in_names():
+    schema = Dict.of(Integer.named('first'),
+                     Integer.named('first_name'),
+                     Dict.named('first_last').of(Integer.named('x')),
+                     Dict.named('a').of(Integer.named('b_c')),
+                     Dict.named('a_b').of(Integer.named('c')))
+    el = schema.from_flat([('first', '1'),
+                           ('first_name', '2'),
+                           ('first_last_x', '3'),
+                           ('a_b_c', '4')])
+    eq_(el['first'].value, 1)
+    eq_(el['first_name'].value, 2)
+    eq_(el['first_last'].value, {'x': 3})
+    eq_(el['a'].value, {'b_c': 4})
+    eq_(el['a_b'].value, {'c': 4})
+
+
+def test_dict_set_flat_custom_separator():
+    schema = Dict.named('top').of(
+        Integer.named('a_b'),
+        Dict.named('sub').of(Integer.named('x')))
+    el = schema()
+    el.set_flat([('top.a_b', '1'), ('top.sub.x', '2'), ('top_sub_x', '3')],
+                sep='.')
+    eq_(el.value, {'a_b': 1, 'sub': {'x': 2}})
+
+
+def test_sparsedict_set_flat_nested():
+    schema = SparseDict.of(Integer.named('x'),
+                           SparseDict.named('sub').of(Integer.named('y'),
+                                                      Integer.named('z')))
+    el = schema.from_flat([('sub_y', '1')])
+    eq_(el.value, {'sub': {'y': 1}})
+
+    el = schema.from_flat([('sub_nope', '1')])
+    eq_(el.value, {'sub': {}})
+
+
+def test_dict_lazy_children():
+    schema = Dict.of(Integer.named('x'),
+                     Integer.named('y').using(default=2),
+                     Dict.named('sub').of(Integer.named('z')))
+    lazy = schema.using(lazy_children=True)
+
+    el = lazy()
+    eq_(dict.__len__(el), 0)
+    assert 'x' in el and 'sub' in el
+    assert 'nope' not in el
+    eq_(len(el), 3)
+
+    el['sub']['z'] = 5
+    eq_(sorted(dict.keys(el)), ['sub'])
+    eq_(dict.__len__(el['sub']), 1)
+    assert el['sub'].parent is el
+
+    eq_(list(el.keys()), ['x', 'y', 'sub'])
+    eq_(el.value, {'x': None, 'y': None, 'sub': {'z': 5}})
+    assert_raises(KeyError, el.__getitem__, 'nope')
+    assert_raises(TypeError, el.__setitem__, 'nope', 1)
+
+
+def test_dict_lazy_children_matches_eager():
+    schema = Dict.named('d').of(Integer.named('x'),
+                                Integer.named('y').using(default=2),
+                                Dict.named('sub').of(Integer.named('z')))
+    lazy = schema.using(lazy_children=True)
+    pairs = [('d_y', '7'), ('d_sub_z', 'nope')]
+
+    for make in (lambda s: s(), lambda s: s.from_defaults(),
+                 lambda s: s.from_flat(pairs),
+                 lambda s: s({'x': 1}), lambda s: s({'sub': {'z': 3}})):
+        eager_el, lazy_el = make(schema), make(lazy)
+        eq_(lazy_el.value, eager_el.value)
+        eq_(lazy_el.validate(), eager_el.validate())
+        eq_([(k, v.valid, v.errors) for k, v in lazy_el.items()],
+            [(k, v.valid, v.errors) for k, v in eager_el.items()])
+
+    # dict methods that bypass iteration see every child too
+    for view in (repr, str, dict, lambda el: el.copy(),
+                 lambda el: list(reversed(el)), lambda el: el | {}):
+        eq_(view(lazy()), view(schema()))
+        eq_(view(lazy.from_flat(pairs)), view(schema.from_flat(pairs)))
+
+
+def test_dict_lazy_children_field_order():
+    schema = Dict.named('d').of(String.named('a'), String.named('b'),
+                                String.named('c'))
+    lazy = schema.using(lazy_children=True)
+    pairs = [('d_b', 'B'), ('d_c', 'C'), ('d_a', 'A')]
+
+    el = lazy.from_flat(pairs)
+    eq_(list(el.keys()), ['a', 'b', 'c'])
+    eq_(el.flatten(), schema.from_flat(pairs).flatten())
+    eq_(list(el.value), ['a', 'b', 'c'])
+
+    el = lazy()
+    el['c'].set('C')
+    el['b']
+    el['a']
+    eq_(list(el), ['a', 'b', 'c'])
+    eq_(el.u, schema({'a': None, 'b': None, 'c': 'C'}).u)
+
+
+def test_dict_lazy_children_sparse_set_flat():
+    schema = Dict.named('d').of(
+        *[Integer.named('f%s' % i) for i in range(50)]).\
+        using(lazy_children=True)
+    el = schema.from_flat([('d_f3', '3'), ('d_f40', '40')])
+    eq_(sorted(dict.keys(el)), ['f3', 'f40'])
+    eq_(el.find('f40', single=True).value, 40)
+    eq_(el['f7'].value, None)
+    eq_(sorted(dict.keys(el)), ['f3', 'f40', 'f7'])
+
+
+
+def test_dict_compile():
+    schema = Dict.named('d').of(
+        String.named('x'),
+        Dict.named('y').of(Integer.named('z')),
+        List.named('l').of(String.named('s')))
+    plan = schema.compile()
+    eq_([field.name for field in plan.fields], ['x', 'y', 'l'])
+    assert plan.field_index['y'] is schema.field_schema[1]
+
+    el = schema()
+    assert el._field_schema_for('x') is plan.field_index['x']
+    assert el._field_schema_for('missing') is None
+
+    override = (String.named('w'),)
+    el = schema(field_schema=override)
+    assert el._field_schema_for('w') is override[0]
+    assert el._field_schema_for('x') is None
+
+
+def test_dict_compile_invalidation():
+    class Sample(Form):
+        name = 'd'
+        x = String
+
+    plan = Sample.compile()
+    eq_(Sample.from_flat({'d_x': '1'}).value, {'x': '1'})
+
+    Sample.field_schema.append(Integer.named('n'))
+    assert not plan.is_current()
+    plan = Sample.compile()
+    eq_(sorted(plan.field_index), ['n', 'x'])
+    eq_(Sample.from_flat({'d_x': '1', 'd_n': '2'}).value,
+        {'x': '1', 'n': 2})
+    assert Sample()._field_schema_for('n') is Sample.field_schema[1]
+
+    Sample.field_schema[0] = String.named('y')
+    eq_(sorted(Sample.field_schema_mapping), ['n', 'y'])
+    eq_(Sample.from_flat({'d_x': '1', 'd_y': '3'}).value,
+        {'y': '3', 'n': None})
+
+    Sample.field_schema = [String.named('z')]
+    eq_(Sample.from_flat({'d_y': '1', 'd_z': '4'}).value, {'z': '4'})
+
+    override = [String.named('w')]
+    el = Sample(field_schema=override)
+    assert el._field_schema_for('v') is None
+    override.append(String.named('v'))
+    assert el._field_schema_for('v') is override[1]
+
+
+def test_dict_field_schema_mapping():
+    schema = Dict.of(String.named('x'), Integer.named('y'))
+    mapping = schema.field_schema_mapping
+    assert schema.field_schema_mapping is mapping
+    assert schema().field_schema_mapping is mapping
+    eq_(sorted(mapping), ['x', 'y'])
+    assert mapping['y'] is schema.field_schema[1]
+
+    el = schema(field_schema=[String.named('z')])
+    assert el.field_schema_mapping is el.field_schema_mapping
+    eq_(list(el.field_schema_mapping), ['z'])
+
+    el.field_schema = [Integer.named('w')]
+    eq_(list(el.field_schema_mapping), ['w'])
+    assert el._field_schema_for('z') is None
+
+    schema.field_schema = [Integer.named('v')]
+    eq_(list(schema.field_schema_mapping), ['v'])
+
+
+def test_sparsedict_setitem_uses_field_index():
+    schema = SparseDict.of(String.named('x'), Integer.named('y'))
+    el = schema()
+    el.update(x='a', y='1')
+    eq_(el.value, {'x': 'a', 'y': 1})
+    assert_raises(TypeError, el.__setitem__, 'z', 1)
+
 def test_dict_as_unicode():
     schema = Dict.of(Integer.named('x'), Integer.named('y'))
     el = schema({'x': 1, 'y': 2})
@@ -147,3 +147,20 @@ def test_inheritance_diamond():
 
     assert len(BA4.field_schema) == 3
     assert isinstance(BA4()['ab_member'], String)
+
+
+def test_lazy_children():
+
+    class Schema(Form):
+        lazy_children = True
+
+        x = String
+        y = Integer.using(default=3)
+
+    el = Schema()
+    eq_(dict.__len__(el), 0)
+    eq_(sorted(el.keys()), ['x', 'y'])
+
+    el = Schema.from_defaults()
+    eq_(el.value, dict(x=None, y=3))
+    eq_(el['y'].value, 3)
@@ -79,6 +79,32 @@ def test_set_flat_unpruned():
     eq_(el.value, [0, None])
 
 
+def test_set_flat_pruned_maximum_keeps_lowest():
+    pairs = [('l_9_i', '9'), ('l_4_i', '4'), ('l_7_i', '7'), ('l_1_i', '1'),
+             ('l_9_i', '99'), ('l_4_i', '44')]
+
+    schema = List.named('l').of(Integer.named('i')).using(
+        maximum_set_flat_members=2)
+    el = schema.from_flat(pairs)
+
+    eq_(el.value, [1, 4])
+
+
+def test_set_flat_iterator():
+    from flatland import Dict
+
+    schema = Dict.named('d').of(
+        String.named('s'),
+        List.named('l').of(Dict.named('r').of(Integer.named('x'),
+                                              Integer.named('y'))))
+    pairs = [('d_l_1_r_x', '3'), ('d_s', 'a'), ('d_l_0_r_y', '2'),
+             ('d_l_0_r_x', '1'), ('d_l_1_r_y', '4'), ('d_s', 'b')]
+
+    el = schema.from_flat(iter(pairs))
+    eq_(el.value, {'s': 'a', 'l': [{'x': 1, 'y': 2}, {'x': 3, 'y': 4}]})
+    eq_(el.flatten(), schema.from_flat(pairs).flatten())
+
+
 def _assert_set_flat(schema, pairs, bogus=[]):
     el = schema.from_flat(pairs + bogus)
     eq_(len(el), len(pairs))
@@ -138,6 +164,30 @@ def test_set_flat_doubly_anonymous_dict():
     eq_(el[2].value, {'x': 'x2', 'y': None})
 
 
+def test_set_flat_index_parsing():
+    schema = List.named('l').of(Integer.named('i'))
+    pairs = [('l_1_i', '1'), ('l_x1_i', '2'), ('l_1x_i', '3'),
+             ('l__i', '4'), ('l_', '5'), ('ll_2_i', '7'), ('l_2_i', '8')]
+    el = schema.from_flat(pairs)
+    eq_(el.value, [1, 8])
+
+
+def test_set_flat_separator_in_name():
+    schema = List.named('my_list').of(Integer.named('my_int'))
+    pairs = [('my_list_0_my_int', '1'), ('my_list_1_my_int', '2'),
+             ('my_0_my_int', '3')]
+    el = schema.from_flat(pairs)
+    eq_(el.value, [1, 2])
+
+
+def test_set_flat_custom_separator():
+    schema = List.named('l').of(List.named('m').of(Integer.named('i')))
+    el = schema()
+    el.set_flat([('l.0.m.0.i', '1'), ('l.0.m.1.i', '2'), ('l.1.m.0.i', '3'),
+                 ('l_2_m_0_i', '4')], sep='.')
+    eq_(el.value, [[1, 2], [3]])
+
+
 def test_set_default_int():
 
     def factory(count, **kw):
@@ -0,0 +1,65 @@
+from flatland import Dict, Form, Integer, List, String
+from flatland.schema.parallel import (
+    error_summary,
+    summarize_records,
+    validate_flat,
+    )
+from flatland.validation import Converted, Present
+from tests._util import assert_raises, eq_
+
+
+class Record(Form):
+    name = String.using(validators=[Present()])
+    age = Integer.using(validators=[Present(), Converted()])
+    address = Dict.of(String.named('city').using(optional=True))
+
+
+records = [{'name': 'a', 'age': '1'},
+           {'name': '', 'age': '2'},
+           {'name': 'c', 'age': 'x', 'address_city': 'y'},
+           [('name', 'd'), ('age', '4')]]
+
+
+def test_error_summary():
+    el = Record.from_flat(records[2])
+    el.validate()
+    eq_(error_summary(el), {'age': ['age is not correct.']})
+
+    el['address']['city'].add_error('bad city')
+    eq_(error_summary(el, '.'), {'age': ['age is not correct.'],
+                                 'address.city': ['bad city']})
+
+    named = Dict.named('r').of(String.named('s'))()
+    named.add_error('root')
+    named['s'].add_error('child')
+    eq_(error_summary(named), {'r': ['root'], 'r_s': ['child']})
+
+    rows = List.named('items').of(Integer.named('n'), String.named('s'))
+    el = Form.of(rows).from_flat({'items_0_n': 'x', 'items_1_n': 'y',
+                                  'items_1_s': 'b'})
+    el['items'][0]['n'].add_error('first')
+    el['items'][1]['n'].add_error('second')
+    el['items'][1].add_error('row')
+    eq_(error_summary(el), {'items_0_n': ['first'],
+                            'items_1_n': ['second'],
+                            'items_1': ['row']})
+    eq_(error_summary(el['items'][1], '.'), {'': ['row'],
+                                             'n': ['second']})
+
+
+def test_summarize_records():
+    summaries = summarize_records(Record, records)
+    eq_([valid for valid, _ in summaries], [True, False, False, True])
+    eq_(summaries[1][1], {'name': ['name may not be blank.']})
+
+
+def test_validate_flat():
+    stream = iter(records * 5)
+    summaries = list(validate_flat(Record, stream, max_workers=2,
+                                   chunksize=3))
+    eq_(summaries, summarize_records(Record, records) * 5)
+
+
+def test_validate_flat_chunksize():
+    assert_raises(ValueError, list, validate_flat(Record, records,
+                                                  chunksize=0))
@@ -1,4 +1,6 @@
 from datetime import date
+import re
+
 from flatland import (
     Array,
     DateYYYYMMDD,
@@ -8,6 +10,9 @@ from flatland import (
     List,
     )
 from flatland.schema.paths import (
+    ExpressionCache,
+    expression_cache,
+    GLOB,
     NAME,
     SLICE,
     TOP,
@@ -29,6 +34,7 @@ up = (UP, None)
 here = (HERE, None)
 name = lambda x: (NAME, x)
 sl = lambda x: (SLICE, x)
+glob = lambda x: (GLOB, re.compile(x, re.DOTALL).fullmatch)
 
 
 def test_tokenize():
@@ -61,6 +67,11 @@ def test_tokenize():
         ('[:5]', [sl(slice(0, 5))]),
         ('[-5:]', [sl(slice(-5, None))]),
         ('[1:8:2]', [sl(slice(1, 8, 2))]),
+        ('*', [glob('.*')]),
+        ('foo/*/baz', [name('foo'), glob('.*'), name('baz')]),
+        ('sneep/_*/squiznart', [name('sneep'), glob('_.*'), name('squiznart')]),
+        ('a?c[:]', [glob('a.c'), sl(slice(None))]),
+        ('/*/..', [top]),
         ]
     for path, expected in _tokencases:
         yield _tokenizes_as, path, expected
@@ -78,6 +89,9 @@ def test_tokenize_escapes():
         (r'foo\/bar', [name(r'foo/bar')]),
         (r'\/foo', [name(r'/foo')]),
         (r'foo\/', [name(r'foo/')]),
+        (r'foo\*', [name('foo*')]),
+        (r'\?', [name('?')]),
+        (r'a\*b*', [glob(r'a\*b.*')]),
         ]
     for path, expected in _tokencases:
         yield _tokenizes_as, path, expected
@@ -158,11 +172,37 @@ def test_evaluation():
         (el, 'dt1', [today]),
         (el, 'dt1/year', [today.year]),
         (el, 'dt1/./year', [today.year]),
+        (el, 'd1/*', [1, 2]),
+        (el, 'd1/d1i?', [1, 2]),
+        (el, '*/d1i2', [2]),
+        (el, 'l?', [[3, 3], [{'l2i1': 4, 'l2i2': 5}] * 3, [[6, 6], [6, 6]]]),
+        (el, 'l2/*/l2i2', [5, 5, 5]),
+        (el, 'a1/*', [10, 11, 12, 13, 14, 15]),
+        (el, 'a1/?', [10, 11, 12, 13, 14, 15]),
+        (el, 'a1/1*', [11]),
+        (el, 'l3/*/1', [6, 6]),
+        (el, 'd1/x*', []),
         ]
     for element, path, expected in _finders:
         yield _finds, element, path, expected
 
 
+def test_iterfind():
+    el = Schema.from_defaults()
+
+    found = el.iterfind('a1[::-1]')
+    assert next(found).value == 15
+    assert [e.value for e in found] == [14, 13, 12, 11, 10]
+
+    found = el.iterfind('l3[:]/missing')
+    assert_raises(LookupError, next, found)
+
+    found = el.iterfind('l3[:]/missing', strict=False)
+    assert list(found) == []
+
+    assert list(el.iterfind('l2[:]/l2i1')) == el.find('l2[:]/l2i1')
+
+
 def test_find_strict_loose():
     el = Schema.from_defaults()
     _cases = [
@@ -253,3 +293,48 @@ def test_find_single_messaging():
     message = _find_message(el, 'a1[:]', single=True)
     expected = "Path 'a1[:]' matched multiple elements"
     assert expected in message
+
+
+def test_expression_cache():
+    cache = ExpressionCache(maxsize=2)
+    a = cache.get('a')
+    assert cache.get('a') is a
+    cache.get('b')
+    cache.get('a')
+    cache.get('c')
+    assert 'a' in cache and 'c' in cache and 'b' not in cache
+    assert cache.stats() == {'hits': 2, 'misses': 3, 'evictions': 1,
+                             'size': 2, 'maxsize': 2}
+
+    el = Schema.from_defaults()
+    found = cache.get('d')(el)
+    assert [e.value for e in cache.get('i1')(el)] == [0]
+    assert found == []
+
+    cache.resize(1)
+    assert len(cache) == 1
+    assert cache.stats()['evictions'] == 4
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.stats()['hits'] == cache.stats()['misses'] == 0
+
+
+def test_expression_cache_disabled():
+    cache = ExpressionCache(maxsize=0)
+    first = cache.get('i1')
+    assert [e.value for e in first(Schema.from_defaults())] == [0]
+    assert cache.get('i1') is not first
+    assert len(cache) == 0
+
+
+def test_expression_cache_resize_shared():
+    assert ExpressionCache().stats()['maxsize'] == 1024
+    maxsize = expression_cache.maxsize
+    try:
+        expression_cache.resize(1)
+        pathexpr('a')
+        pathexpr('b')
+        assert len(expression_cache) == 1
+    finally:
+        expression_cache.resize(maxsize)
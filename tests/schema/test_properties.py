@@ -137,6 +137,44 @@ def test_instance_overlay():
     assert Base.properties == {'a': 1, 'b': 2, 'c': 3, 'd': 4}
 
 
+def test_instance_overlay_allocated_on_write():
+    class Base(object):
+        properties = Properties(a=1)
+
+    b = Base()
+    assert b.properties['a'] == 1
+    assert b.properties.get('x') is None
+    assert b.properties.pop('x', None) is None
+    assert 'properties' not in b.__dict__
+
+    b.properties['b'] = 2
+    assert 'properties' in b.__dict__
+    assert b.properties['b'] == 2
+    assert Base().properties.get('b') is None
+
+
+def test_resolution_cached_per_class():
+    Base = String.with_properties(a=1)
+    Deep = Base
+    for _ in range(10):
+        Deep = Deep.named('deep')
+
+    assert Deep.properties is Deep.properties
+    assert Deep.properties['a'] == 1
+    assert Deep().properties['a'] == 1
+
+    Base.properties['a'] = 2
+    assert Deep.properties['a'] == 2
+    assert Deep().properties['a'] == 2
+
+    del Base.properties['a']
+    assert Deep.properties.get('a') is None
+
+    Deep.properties['b'] = 3
+    assert Deep.properties['b'] == 3
+    assert Base.properties.get('b') is None
+
+
 def test_instance_member_assignment():
 
     class Base(object):
@@ -2,7 +2,10 @@ from flatland import (
     Dict,
     Form,
     Integer,
+    String,
+    Unevaluated,
     )
+from flatland.schema.base import compile_validators, validate_element
 from flatland.validation import (
     Converted,
     Present,
@@ -98,3 +101,189 @@ def test_nested_validation():
 
     form.el('d2.x2').set(2)
     assert form.validate()
+
+
+def test_validate_many():
+
+    class MyForm(Form):
+        age = ThirtySomething
+
+        d2 = Dict.of(Integer.named('x2').using(validators=[Present()]))
+
+    rows = [{'age': '35', 'd2_x2': '1'},
+            {'age': '10', 'd2_x2': '1'},
+            {'age': '35'},
+            {'age': '36', 'd2_x2': '2'}]
+    forms = [MyForm.from_flat(row) for row in rows]
+    singles = [MyForm.from_flat(row) for row in rows]
+
+    results = MyForm.validate_many(forms)
+    assert list(results) == [True, False, False, True]
+    assert results.valid == 2 and results.invalid == 2
+    assert len(results) == 4
+    assert not results
+
+    for batched, single in zip(forms, singles):
+        single.validate()
+        assert batched['age'].errors == single['age'].errors
+        assert batched.el('d2.x2').valid == single.el('d2.x2').valid
+
+    assert forms[1]['age'].errors == ['age must be at least 30.']
+
+
+def test_validate_many_instance_overrides():
+
+    class MyForm(Form):
+        x = Integer.using(validators=[Present()])
+
+    lenient = MyForm()
+    lenient['x'].validators = []
+    lenient['x'].optional = True
+    strict = MyForm()
+
+    results = MyForm.validate_many([lenient, strict])
+    assert list(results) == [True, False]
+    assert MyForm.validate_many([]).valid == 0
+
+
+def test_validate_many_wrong_schema():
+
+    class MyForm(Form):
+        x = Integer
+
+    try:
+        MyForm.validate_many([Integer()])
+    except TypeError:
+        pass
+    else:
+        assert False
+
+
+def test_compile_validators():
+    calls = []
+
+    class Recording(Validator):
+        def validate(self, element, state):
+            calls.append(element.value)
+            return element.value != 0
+
+    class Custom(Recording):
+        def __call__(self, element, state):
+            calls.append('called')
+            return Recording.__call__(self, element, state)
+
+    for validators, expected in (
+            ((Recording(),), [1]),
+            ((Custom(),), ['called', 1]),
+            ((lambda el, state: None,), [])):
+        del calls[:]
+        run = compile_validators(validators)
+        el = Integer(1)
+        assert run(el, None) == validate_element(el, None, validators)
+        assert calls == expected * 2
+
+    run = compile_validators(())
+    assert run(Integer(), None) is False
+    assert run(Integer(optional=True), None) is True
+    assert compile_validators(Unevaluated)(Integer(), None) is Unevaluated
+
+
+def test_compiled_chain_changes():
+    S = Integer.using(validators=[lambda el, state: True])
+    assert S(1).validate()
+
+    S.validators.append(lambda el, state: False)
+    assert not S(1).validate()
+
+    del S.validators[1:]
+    assert S(1).validate()
+
+    S.validators = [lambda el, state: False]
+    assert not S(1).validate()
+
+
+def test_validate_incremental():
+    calls = []
+
+    def recording(element, state):
+        calls.append(element.name or 'form')
+        return element.value is not None
+
+    class MyForm(Form):
+        a = Integer.using(validators=[recording])
+        b = Integer.using(validators=[recording])
+        c = Dict.of(Integer.named('d').using(validators=[recording]),
+                    Integer.named('e').using(validators=[recording]))
+        validators = [recording]
+
+    form = MyForm.from_defaults()
+    assert not form.validate(incremental=True)
+    assert sorted(calls) == ['a', 'b', 'd', 'e', 'form']
+
+    del calls[:]
+    assert not form.validate(incremental=True)
+    assert calls == []
+
+    form['c']['d'].set(1)
+    assert not form.validate(incremental=True)
+    assert sorted(calls) == ['d', 'form']
+    assert form['c']['d'].valid
+    assert not form['c']['e'].valid
+
+    del calls[:]
+    form.set_flat({'a': '1', 'b': '2', 'c_d': '3', 'e': 'x', 'c_e': '4'})
+    assert form.validate(incremental=True)
+    assert sorted(calls) == ['a', 'b', 'd', 'e', 'form']
+
+    del calls[:]
+    form['b'].set(None)
+    assert not form.validate(incremental=True)
+    assert sorted(calls) == ['b', 'form']
+    assert not form.validate()
+    assert len(calls) == 7
+
+
+def test_validate_incremental_containers():
+    from flatland import List
+
+    Numbers = List.named('numbers').of(Integer.named('n').using(
+        validators=[Present()]))
+    el = Numbers([1, 2])
+    assert el.validate(incremental=True)
+
+    el.append(None)
+    assert not el.validate(incremental=True)
+    assert not el[2].valid
+
+    del el[2]
+    assert el.validate(incremental=True)
+    assert el.validate()
+
+
+def test_validate_incremental_assignment():
+    calls = []
+
+    def recording(element, state):
+        calls.append(element.name)
+        return True
+
+    Point = Dict.named('p').of(
+        String.named('s').using(validators=[Present()]),
+        Dict.named('c').of(Integer.named('n')).using(validators=[recording]))
+    el = Point({'s': 'x', 'c': {'n': 1}})
+    assert el.validate(incremental=True)
+
+    el['s'].u = ''
+    el['s'].value = None
+    assert not el.validate(incremental=True)
+    assert not el.validate()
+
+    el['s'].value = 'y'
+    el['s'].u = 'y'
+    assert el.validate(incremental=True)
+
+    # routing a flat key through a child container resets it
+    del calls[:]
+    el.set_flat([('p_s', 'y'), ('p_c_unknown', '1')])
+    assert el.validate(incremental=True)
+    assert calls == ['c']
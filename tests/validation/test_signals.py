@@ -54,3 +54,31 @@ def test_validator_validated():
                         state=None, result=True)])
 
     signals.validator_validated._clear_state()
+
+
+def test_validator_validated_after_compiled_run():
+    sentinel = []
+
+    def listener(sender, **kw):
+        sentinel.append(sender)
+
+    schema = String.using(validators=[Present(), NoLongerThan(5)])
+
+    # validated and compiled once without receivers...
+    assert schema('abc').validate()
+    assert not sentinel
+
+    # ...then traced as soon as a receiver is connected
+    signals.validator_validated.connect(listener)
+    try:
+        assert schema('abc').validate()
+        eq_(sentinel, list(schema.validators))
+        del sentinel[:]
+        eq_(list(schema.validate_many([schema('abcdef')])), [False])
+        eq_(sentinel, list(schema.validators))
+    finally:
+        signals.validator_validated._clear_state()
+
+    del sentinel[:]
+    assert schema('abc').validate()
+    assert not sentinel